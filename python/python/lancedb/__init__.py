@@ -19,6 +19,7 @@ from typing import Dict, Optional, Union, Any
 
 __version__ = importlib.metadata.version("lancedb")
 
+from ._lancedb import clear_connection_cache as _clear_connection_cache
 from ._lancedb import connect as lancedb_connect
 from .common import URI, sanitize_uri
 from .db import AsyncConnection, DBConnection, LanceDBConnection
@@ -72,6 +73,14 @@ def connect(
         Additional options for the storage backend. See available options at
         <https://lancedb.github.io/lancedb/guides/storage/>
 
+    Notes
+    -----
+    Connections to the same local or object store database, with the same
+    read_consistency_interval and storage_options, share one native connection
+    (and so its object store and table state). Up to 32 of these are kept for
+    the life of the process; use
+    [clear_connection_cache][lancedb.clear_connection_cache] to release them.
+
     Examples
     --------
 
@@ -168,6 +177,14 @@ async def connect_async(
         Additional options for the storage backend. See available options at
         <https://lancedb.github.io/lancedb/guides/storage/>
 
+    Notes
+    -----
+    Connections to the same local or object store database, with the same
+    read_consistency_interval and storage_options, share one native connection
+    (and so its object store and table state). Up to 32 of these are kept for
+    the life of the process; use
+    [clear_connection_cache][lancedb.clear_connection_cache] to release them.
+
     Examples
     --------
 
@@ -210,7 +227,17 @@ async def connect_async(
     )
 
 
+def clear_connection_cache() -> None:
+    """Release the native connections shared by [connect][lancedb.connect].
+
+    The next connect to a database opens a new native connection. Connections
+    that were already returned keep working.
+    """
+    _clear_connection_cache()
+
+
 __all__ = [
+    "clear_connection_cache",
     "connect",
     "connect_async",
     "AsyncConnection",
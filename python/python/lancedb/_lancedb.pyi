@@ -76,6 +76,7 @@ async def connect(
     host_override: Optional[str],
     read_consistency_interval: Optional[float],
 ) -> Connection: ...
+def clear_connection_cache() -> None: ...
 
 class RecordBatchStream:
     def schema(self) -> pa.Schema: ...
@@ -131,6 +132,9 @@ class HybridQuery:
     def bypass_vector_index(self): ...
     def to_vector_query(self) -> VectorQuery: ...
     def to_fts_query(self) -> FTSQuery: ...
+    async def execute_legs(
+        self, max_batch_length: Optional[int] = None
+    ) -> Tuple[RecordBatchStream, RecordBatchStream]: ...
     def get_limit(self) -> int: ...
     def get_with_row_id(self) -> bool: ...
 
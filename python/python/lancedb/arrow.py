@@ -1,3 +1,5 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 import pyarrow as pa
@@ -42,3 +44,54 @@ class AsyncRecordBatchReader:
         if next is None:
             raise StopAsyncIteration
         return next
+
+
+def _to_prefetching_reader(
+    reader: AsyncRecordBatchReader, loop: asyncio.AbstractEventLoop
+) -> pa.RecordBatchReader:
+    """
+    Adapt an AsyncRecordBatchReader running on ``loop`` into a synchronous
+    pyarrow RecordBatchReader.
+
+    The next batch is requested as soon as the current one is handed out, so
+    fetching and decoding it overlaps with whatever the caller does with the
+    current batch. If the reader is consumed from the thread running ``loop``,
+    which can't wait on itself, batches are fetched one at a time instead.
+    """
+
+    def fetch():
+        return asyncio.run_coroutine_threadsafe(reader.__anext__(), loop)
+
+    def batches():
+        future = fetch()
+        try:
+            while True:
+                try:
+                    batch = future.result()
+                except StopAsyncIteration:
+                    return
+                future = fetch()
+                yield batch
+        finally:
+            future.cancel()
+
+    def batches_without_loop():
+        # run each fetch on a private event loop in a worker thread instead
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            try:
+                while True:
+                    yield executor.submit(asyncio.run, reader.__anext__()).result()
+            except StopAsyncIteration:
+                return
+
+    def read():
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            yield from batches_without_loop()
+        else:
+            yield from batches()
+
+    return pa.RecordBatchReader.from_batches(reader.schema, read())
@@ -13,14 +13,23 @@
 
 from __future__ import annotations
 
-from abc import abstractmethod
+import time
+from abc import ABC, abstractmethod
+from datetime import timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, Iterable, List, Literal, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from lancedb.embeddings.registry import EmbeddingFunctionRegistry
-from overrides import EnforceOverrides, override  # type: ignore
-
-from lancedb.common import data_to_reader, sanitize_uri, validate_schema
 from lancedb.background_loop import LOOP
 
 from ._lancedb import connect as lancedb_connect  # type: ignore
@@ -38,14 +47,21 @@ from .util import (
 if TYPE_CHECKING:
     import pyarrow as pa
     from .pydantic import LanceModel
-    from datetime import timedelta
 
     from ._lancedb import Connection as LanceDbConnection
     from .common import DATA, URI
     from .embeddings import EmbeddingFunctionConfig
 
 
-class DBConnection(EnforceOverrides):
+_CREATE_MODES = frozenset({"create", "overwrite"})
+
+# How long len(db) and `name in db` reuse the last table listing when the
+# connection has no read_consistency_interval. Tables created or dropped through
+# the connection take effect immediately regardless.
+TABLE_NAMES_CACHE_TTL = timedelta(seconds=1)
+
+
+class DBConnection(ABC):
     """An active LanceDB connection interface."""
 
     @abstractmethod
@@ -363,18 +379,24 @@ class LanceDBConnection(DBConnection):
         read_consistency_interval: Optional[timedelta] = None,
         storage_options: Optional[Dict[str, str]] = None,
     ):
-        if not isinstance(uri, Path):
-            scheme = get_uri_scheme(uri)
-        is_local = isinstance(uri, Path) or scheme == "file"
+        if isinstance(uri, Path) or "://" not in uri:
+            # plain paths (including windows drive paths) don't need URL parsing
+            is_local = True
+        else:
+            is_local = get_uri_scheme(uri) == "file"
         if is_local:
-            if isinstance(uri, str):
-                uri = Path(uri)
-            uri = uri.expanduser().absolute()
-            Path(uri).mkdir(parents=True, exist_ok=True)
-        self._uri = str(uri)
+            path = Path(uri).expanduser().absolute()
+            if not path.is_dir():
+                path.mkdir(parents=True, exist_ok=True)
+            uri = str(path)
+        # The canonical form of the uri, also used to connect below so that
+        # e.g. "./db" and its absolute path share the same native connection.
+        self._uri = uri
         self._entered = False
         self.read_consistency_interval = read_consistency_interval
         self.storage_options = storage_options
+        # (time.monotonic() of the listing, sorted names, the names as a set)
+        self._table_names_cache: Optional[Tuple[float, List[str], FrozenSet]] = None
 
         if read_consistency_interval is not None:
             read_consistency_interval_secs = read_consistency_interval.total_seconds()
@@ -383,7 +405,7 @@ class LanceDBConnection(DBConnection):
 
         async def do_connect():
             return await lancedb_connect(
-                sanitize_uri(uri),
+                self._uri,
                 None,
                 None,
                 None,
@@ -401,11 +423,13 @@ class LanceDBConnection(DBConnection):
         val += ")"
         return val
 
-    async def _async_get_table_names(self, start_after: Optional[str], limit: int):
-        conn = AsyncConnection(await lancedb_connect(self.uri))
-        return await conn.table_names(start_after=start_after, limit=limit)
+    async def _async_get_table_names(
+        self, start_after: Optional[str], limit: Optional[int]
+    ) -> List[str]:
+        # Straight to the native connection; AsyncConnection.table_names is a
+        # pass-through and would only add another coroutine per call.
+        return await self._conn._inner.table_names(start_after=start_after, limit=limit)
 
-    @override
     def table_names(
         self, page_token: Optional[str] = None, limit: int = 10
     ) -> Iterable[str]:
@@ -416,15 +440,37 @@ class LanceDBConnection(DBConnection):
         Iterator of str.
             A list of table names.
         """
-        return LOOP.run(self._conn.table_names(start_after=page_token, limit=limit))
+        return LOOP.run(self._async_get_table_names(page_token, limit))
+
+    def _snapshot_tables(self) -> Tuple[List[str], FrozenSet[str]]:
+        """All table names, sorted, along with a set of the same names.
+
+        The listing is reused until ``read_consistency_interval`` (or
+        ``TABLE_NAMES_CACHE_TTL`` if it is None) has passed, and is invalidated
+        when this connection creates or drops tables.
+        """
+        now = time.monotonic()
+        if self._table_names_cache is not None:
+            listed_at, names, name_set = self._table_names_cache
+            interval = self.read_consistency_interval
+            if interval is None:
+                interval = TABLE_NAMES_CACHE_TTL
+            if now - listed_at < interval.total_seconds():
+                return names, name_set
+        names = LOOP.run(self._async_get_table_names(None, None))
+        name_set = frozenset(names)
+        self._table_names_cache = (now, names, name_set)
+        return names, name_set
+
+    def _invalidate_table_names(self):
+        self._table_names_cache = None
 
     def __len__(self) -> int:
-        return len(self.table_names())
+        return len(self._snapshot_tables()[0])
 
     def __contains__(self, name: str) -> bool:
-        return name in self.table_names()
+        return name in self._snapshot_tables()[1]
 
-    @override
     def create_table(
         self,
         name: str,
@@ -446,7 +492,7 @@ class LanceDBConnection(DBConnection):
         ---
         DBConnection.create_table
         """
-        if mode.lower() not in ["create", "overwrite"]:
+        if mode not in _CREATE_MODES and mode.lower() not in _CREATE_MODES:
             raise ValueError("mode must be either 'create' or 'overwrite'")
         validate_table_name(name)
 
@@ -466,7 +512,6 @@ class LanceDBConnection(DBConnection):
         )
         return tbl
 
-    @override
     def open_table(
         self,
         name: str,
@@ -492,7 +537,6 @@ class LanceDBConnection(DBConnection):
             index_cache_size=index_cache_size,
         )
 
-    @override
     def drop_table(self, name: str, ignore_missing: bool = False):
         """Drop a table from the database.
 
@@ -503,11 +547,16 @@ class LanceDBConnection(DBConnection):
         ignore_missing: bool, default False
             If True, ignore if the table does not exist.
         """
-        LOOP.run(self._conn.drop_table(name, ignore_missing=ignore_missing))
+        try:
+            LOOP.run(self._conn.drop_table(name, ignore_missing=ignore_missing))
+        finally:
+            self._invalidate_table_names()
 
-    @override
     def drop_database(self):
-        LOOP.run(self._conn.drop_database())
+        try:
+            LOOP.run(self._conn.drop_database())
+        finally:
+            self._invalidate_table_names()
 
 
 class AsyncConnection(object):
@@ -795,7 +844,6 @@ class AsyncConnection(object):
         data, schema = sanitize_create_table(
             data, schema, metadata, on_bad_vectors, fill_value
         )
-        validate_schema(schema)
 
         if exist_ok is None:
             exist_ok = False
@@ -817,11 +865,10 @@ class AsyncConnection(object):
                 enable_v2_manifest_paths=enable_v2_manifest_paths,
             )
         else:
-            data = data_to_reader(data, schema)
             new_table = await self._inner.create_table(
                 name,
                 mode,
-                data,
+                data.to_reader(),
                 storage_options=storage_options,
                 data_storage_version=data_storage_version,
                 enable_v2_manifest_paths=enable_v2_manifest_paths,
@@ -10,14 +10,25 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from typing import List
+import contextlib
+import functools
+import logging
+from typing import List, Literal
 
 import numpy as np
 
 from ..util import attempt_import_or_raise
 from .base import TextEmbeddingFunction
 from .registry import register
-from .utils import TEXT, weak_lru
+from .utils import TEXT
+
+# Output dimensions of the published instructor models, so that ndims()
+# does not need to load the model and run a forward pass.
+KNOWN_DIMS = {
+    "hkunlp/instructor-base": 768,
+    "hkunlp/instructor-large": 768,
+    "hkunlp/instructor-xl": 768,
+}
 
 
 @register("instructor")
@@ -57,6 +68,17 @@ class InstructorEmbeddingFunction(TextEmbeddingFunction):
         Whether to normalize the embeddings
     quantize: bool, default False
         Whether to quantize the model
+    precision: str, default "fp32"
+        The precision to run inference in on CUDA devices. One of "fp32", "fp16"
+        or "bf16". "bf16" falls back to "fp16" on GPUs that do not support it.
+        Ignored for non-CUDA devices.
+    compile: bool, default False
+        Whether to wrap the transformer with ``torch.compile``. This speeds up
+        repeated encoding at the cost of slower model loading. Falls back to
+        eager mode if compilation fails. Ignored when ``quantize`` is set or
+        when torch does not support it.
+    dedupe: bool, default True
+        Whether to encode repeated texts in a batch only once.
     source_instruction: str, default "represent the document for retrieval"
         The instruction for the source column
     query_instruction: str, default "represent the document for retrieving the most
@@ -100,6 +122,9 @@ class InstructorEmbeddingFunction(TextEmbeddingFunction):
     show_progress_bar: bool = True
     normalize_embeddings: bool = True
     quantize: bool = False
+    precision: Literal["fp32", "fp16", "bf16"] = "fp32"
+    compile: bool = False
+    dedupe: bool = True
     # convert_to_numpy: bool = True # Hardcoding this as numpy can be ingested directly
 
     source_instruction: str = "represent the document for retrieval"
@@ -107,44 +132,104 @@ class InstructorEmbeddingFunction(TextEmbeddingFunction):
         "represent the document for retrieving the most similar documents"
     )
 
-    @weak_lru(maxsize=1)
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._ndims = None
+
     def ndims(self):
-        model = self.get_model()
-        return model.encode("foo").shape[0]
+        if self._ndims is None:
+            self._ndims = KNOWN_DIMS.get(self.name)
+        if self._ndims is None:
+            self._ndims = self.get_model().encode("foo").shape[0]
+        return self._ndims
 
-    def compute_query_embeddings(self, query: str, *args, **kwargs) -> List[np.array]:
-        return self.generate_embeddings([[self.query_instruction, query]])
+    def compute_query_embeddings(self, query: TEXT, *args, **kwargs) -> List[np.array]:
+        return self._encode_with_instruction(self.query_instruction, query)
 
     def compute_source_embeddings(self, texts: TEXT, *args, **kwargs) -> List[np.array]:
+        return self._encode_with_instruction(self.source_instruction, texts)
+
+    def _encode_with_instruction(self, instruction: str, texts: TEXT) -> List:
+        """
+        Pair every text with the given instruction and encode them in one call.
+
+        Both the query and the source paths go through here so that they share
+        batching and tokenization. The pairs are handed to ``model.encode`` as is,
+        since INSTRUCTOR uses them to exclude the instruction tokens from pooling.
+        """
         texts = self.sanitize_input(texts)
-        texts_formatted = [[self.source_instruction, text] for text in texts]
-        return self.generate_embeddings(texts_formatted)
+        if not self.dedupe:
+            return self.generate_embeddings([[instruction, text] for text in texts])
+        # encode every distinct text once, then scatter back to the input order
+        positions = {}
+        order = [positions.setdefault(text, len(positions)) for text in texts]
+        embeddings = self.generate_embeddings(
+            [[instruction, text] for text in positions]
+        )
+        return [embeddings[i] for i in order]
 
     def generate_embeddings(self, texts: List) -> List:
         model = self.get_model()
-        res = model.encode(
-            texts,
-            batch_size=self.batch_size,
-            show_progress_bar=self.show_progress_bar,
-            normalize_embeddings=self.normalize_embeddings,
-            device=self.device,
-        ).tolist()
-        return res
-
-    @weak_lru(maxsize=1)
-    def get_model(self):
-        instructor_embedding = attempt_import_or_raise(
-            "InstructorEmbedding", "InstructorEmbedding"
-        )
+        with self._autocast():
+            res = model.encode(
+                texts,
+                batch_size=self.batch_size,
+                show_progress_bar=self.show_progress_bar,
+                normalize_embeddings=self.normalize_embeddings,
+                device=self.device,
+                convert_to_numpy=True,
+            )
+        # iterating a 2D array yields row views, avoiding a python float per value
+        return list(res)
+
+    def _autocast(self):
+        if self.precision == "fp32" or not self.device.startswith("cuda"):
+            return contextlib.nullcontext()
         torch = attempt_import_or_raise("torch", "torch")
+        if self.precision == "bf16" and torch.cuda.is_bf16_supported():
+            dtype = torch.bfloat16
+        else:
+            dtype = torch.float16
+        return torch.autocast(device_type="cuda", dtype=dtype)
 
-        model = instructor_embedding.INSTRUCTOR(self.name)
-        if self.quantize:
-            if (
-                "qnnpack" in torch.backends.quantized.supported_engines
-            ):  # fix for https://github.com/pytorch/pytorch/issues/29327
-                torch.backends.quantized.engine = "qnnpack"
-            model = torch.quantization.quantize_dynamic(
-                model, {torch.nn.Linear}, dtype=torch.qint8
-            )
-        return model
+    def get_model(self):
+        return _load_model(self.name, self.device, self.quantize, self.compile)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_model(name: str, device: str, quantize: bool, compile: bool):
+    instructor_embedding = attempt_import_or_raise(
+        "InstructorEmbedding", "InstructorEmbedding"
+    )
+    torch = attempt_import_or_raise("torch", "torch")
+
+    model = instructor_embedding.INSTRUCTOR(name, device=device)
+    if quantize:
+        if (
+            "qnnpack" in torch.backends.quantized.supported_engines
+        ):  # fix for https://github.com/pytorch/pytorch/issues/29327
+            torch.backends.quantized.engine = "qnnpack"
+        # the token embedding matrix is the largest single tensor in these
+        # models, so quantize it (weight-only) along with the linear layers
+        weight_only = torch.ao.quantization.float_qparams_weight_only_qconfig
+        qconfig_spec = {
+            torch.nn.Linear: torch.ao.quantization.default_dynamic_qconfig,
+            torch.nn.Embedding: weight_only,
+            torch.nn.EmbeddingBag: weight_only,
+        }
+        model = torch.ao.quantization.quantize_dynamic(
+            model, qconfig_spec, dtype=torch.qint8
+        )
+    elif compile and hasattr(torch, "compile"):
+        transformer = model._first_module()
+        eager = transformer.auto_model
+        try:
+            transformer.auto_model = torch.compile(eager, dynamic=True)
+            # compilation is lazy, so run a forward pass to surface any
+            # backend errors here rather than on the first real batch
+            model.encode("warm up", device=device)
+        except Exception as e:
+            # e.g. unsupported platform / python version, fall back to eager mode
+            logging.warning("Failed to compile instructor model: %s", e)
+            transformer.auto_model = eager
+    return model
@@ -4,7 +4,8 @@
 """Full text search index using tantivy-py"""
 
 import os
-from typing import List, Tuple, Optional
+import threading
+from typing import Dict, List, Tuple, Optional
 
 import pyarrow as pa
 
@@ -17,6 +18,10 @@ except ImportError:
 
 from .table import LanceTable
 
+# opened indices keyed by path, along with the meta.json stat they were opened at
+_INDEX_CACHE: Dict[str, Tuple[Tuple[int, int], tantivy.Index]] = {}
+_INDEX_CACHE_LOCK = threading.Lock()
+
 
 def create_index(
     index_path: str,
@@ -161,6 +166,34 @@ def resolve_path(schema, field_name: str) -> pa.Field:
     return field
 
 
+def open_index(index_path: str) -> tantivy.Index:
+    """
+    Open an existing index, reusing a previously opened handle
+
+    The handle is reopened whenever the index's meta.json changes, i.e. after
+    every commit or when the index is recreated.
+
+    Parameters
+    ----------
+    index_path : str
+        Path to the index directory
+
+    Returns
+    -------
+    index : tantivy.Index
+        The index object
+    """
+    st = os.stat(os.path.join(index_path, "meta.json"))
+    version = (st.st_mtime_ns, st.st_ino)
+    with _INDEX_CACHE_LOCK:
+        cached = _INDEX_CACHE.get(index_path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        index = tantivy.Index.open(index_path)
+        _INDEX_CACHE[index_path] = (version, index)
+        return index
+
+
 def search_index(
     index: tantivy.Index, query: str, limit: int = 10, ordering_field=None
 ) -> Tuple[Tuple[int], Tuple[float]]:
@@ -3,6 +3,9 @@
 
 from __future__ import annotations
 
+import functools
+import threading
+from collections import OrderedDict
 from abc import ABC, abstractmethod
 from concurrent.futures import ThreadPoolExecutor
 from typing import (
@@ -25,10 +28,11 @@ import pydantic
 
 from . import __version__
 from .arrow import AsyncRecordBatchReader
+from .pydantic import PYDANTIC_VERSION
 from .rerankers.base import Reranker
 from .rerankers.rrf import RRFReranker
 from .rerankers.util import check_reranker_result
-from .util import safe_import_pandas, flatten_columns
+from .util import safe_import_pandas, flatten_columns, sql_filter_to_expression
 
 if TYPE_CHECKING:
     import PIL
@@ -39,19 +43,108 @@ if TYPE_CHECKING:
     from ._lancedb import HybridQuery as LanceHybridQuery
     from ._lancedb import VectorQuery as LanceVectorQuery
     from .common import VEC
+    from .embeddings import EmbeddingFunction
     from .pydantic import LanceModel
     from .table import Table
 
 pd = safe_import_pandas()
 
+# Shared by hybrid queries to run the FTS search and reranker warm up alongside
+# the vector search, instead of starting a new pool for every query.
+_HYBRID_POOL = ThreadPoolExecutor(thread_name_prefix="lancedb-hybrid")
+
+# Number of text query embeddings to remember across searches
+QUERY_EMBEDDING_CACHE_SIZE = 256
+
+
+# (embedding function class, frozen config, query) -> embedding, oldest first
+_query_embedding_cache: "OrderedDict[tuple, object]" = OrderedDict()
+_query_embedding_cache_lock = threading.Lock()
+
+
+def _freeze(value):
+    # turn the dumped config into something hashable, so it can be a cache key
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    return value
+
+
+def _query_embedding_key(function: "EmbeddingFunction", query: str):
+    # Key on the class and the public fields only. The instance itself can't be
+    # used: its __eq__ ignores the class, models loaded lazily into __dict__
+    # change its hash, and the cache would keep the models alive.
+    cls = type(function)
+    key = (
+        f"{cls.__module__}.{cls.__qualname__}",
+        _freeze(function.safe_model_dump()),
+        query,
+    )
+    hash(key)
+    return key
+
+
+def _cached_query_embedding(function: "EmbeddingFunction", query: str):
+    try:
+        key = _query_embedding_key(function, query)
+    except TypeError:
+        # configuration holds unhashable values, can't be used as a key
+        return function.compute_query_embeddings_with_retry(query)[0]
+    with _query_embedding_cache_lock:
+        if key in _query_embedding_cache:
+            _query_embedding_cache.move_to_end(key)
+            return _query_embedding_cache[key]
+    embedding = function.compute_query_embeddings_with_retry(query)[0]
+    with _query_embedding_cache_lock:
+        _query_embedding_cache[key] = embedding
+        while len(_query_embedding_cache) > QUERY_EMBEDDING_CACHE_SIZE:
+            _query_embedding_cache.popitem(last=False)
+    return embedding
+
+
+def _compute_query_embedding(function: "EmbeddingFunction", query):
+    """
+    Embed a single query. Text queries are cached, keyed on the query and the
+    embedding function's class and configuration, so repeating a search skips
+    the model.
+    """
+    if isinstance(query, str):
+        embedding = _cached_query_embedding(function, query)
+        # hand out a copy so callers can't modify the cached value
+        if isinstance(embedding, np.ndarray):
+            return embedding.copy()
+        if isinstance(embedding, list):
+            return list(embedding)
+        return embedding
+    return function.compute_query_embeddings_with_retry(query)[0]
+
+
+@functools.lru_cache(maxsize=128)
+def _model_list_adapter(model: Type["LanceModel"]):
+    # building the adapter compiles a validator, so reuse it per model
+    return pydantic.TypeAdapter(List[model])
+
+
+@functools.lru_cache(maxsize=64)
+def _normalized_ranks(n: int) -> np.ndarray:
+    # the normalized ranks only depend on the number of results, which is
+    # usually the query limit, so compute them once per size
+    ranks = np.arange(n, dtype=np.float32)
+    np.divide(ranks, n - 1, out=ranks)
+    ranks.flags.writeable = False
+    return ranks
+
 
 class Query(pydantic.BaseModel):
     """The LanceDB Query
 
     Attributes
     ----------
-    vector : List[float]
-        the vector to search for
+    vector : np.ndarray or List[float] or List[List[float]]
+        the vector to search for, or one vector per row for multiple queries
     filter : Optional[str]
         sql filter to refine the query with, optional
     prefilter : bool
@@ -88,10 +181,18 @@ class Query(pydantic.BaseModel):
         - *default False*.
     """
 
+    if PYDANTIC_VERSION.major < 2:  # Pydantic 1.x compat
+
+        class Config:
+            arbitrary_types_allowed = True
+    else:
+        model_config = dict(arbitrary_types_allowed=True)
+
     vector_column: Optional[str] = None
 
-    # vector to search for
-    vector: Union[List[float], List[List[float]]]
+    # vector to search for. ndarray comes first so that numpy queries are
+    # passed through as-is instead of being validated element by element
+    vector: Union[np.ndarray, List[float], List[List[float]]]
 
     # sql filter to refine the query with
     filter: Optional[str] = None
@@ -228,7 +329,7 @@ class LanceQueryBuilder(ABC):
             else:
                 conf = table.embedding_functions.get(vector_column_name)
                 if conf is not None:
-                    query = conf.function.compute_query_embeddings_with_retry(query)[0]
+                    query = _compute_query_embedding(conf.function, query)
                     return query, "vector"
                 else:
                     return query, "fts"
@@ -243,7 +344,7 @@ class LanceQueryBuilder(ABC):
             return query
         conf = table.embedding_functions.get(vector_column_name)
         if conf is not None:
-            return conf.function.compute_query_embeddings_with_retry(query)[0]
+            return _compute_query_embedding(conf.function, query)
         else:
             msg = f"No embedding function for {vector_column_name}"
             raise ValueError(msg)
@@ -338,10 +439,15 @@ class LanceQueryBuilder(ABC):
         -------
         List[LanceModel]
         """
-        return [
-            model(**{k: v for k, v in row.items() if k in model.field_names()})
-            for row in self.to_arrow().to_pylist()
-        ]
+        # drop the columns the model doesn't have before converting to Python
+        field_names = set(model.field_names())
+        tbl = self.to_arrow()
+        tbl = tbl.select([name for name in tbl.column_names if name in field_names])
+        rows = tbl.to_pylist()
+        if PYDANTIC_VERSION.major < 2:
+            return [model(**row) for row in rows]
+        # validate all rows in a single call instead of one model at a time
+        return _model_list_adapter(model).validate_python(rows)
 
     def to_polars(self) -> "pl.DataFrame":
         """
@@ -730,10 +836,53 @@ class LanceVectorQueryBuilder(LanceQueryBuilder):
         -------
         pa.RecordBatchReader
         """
-        vector = self._query if isinstance(self._query, list) else self._query.tolist()
-        if isinstance(vector[0], np.ndarray):
-            vector = [v.tolist() for v in vector]
-        query = Query(
+        result_set = self._table._execute_query(self._to_query(), batch_size)
+        return self._rerank_result_set(result_set)
+
+    @staticmethod
+    def to_batches_many(
+        builders: List[LanceVectorQueryBuilder], batch_size: Optional[int] = None
+    ) -> List[pa.RecordBatchReader]:
+        """
+        Execute several vector queries, returning one RecordBatchReader per query.
+
+        Queries against the same table are executed together, so for remote
+        tables the round trips overlap instead of happening one after another.
+
+        Parameters
+        ----------
+        builders: List[LanceVectorQueryBuilder]
+            The queries to execute.
+        batch_size: int
+            The maximum number of selected records in a RecordBatch object.
+
+        Returns
+        -------
+        List[pa.RecordBatchReader]
+            The results, in the same order as `builders`.
+        """
+        by_table: Dict[int, List[int]] = {}
+        for i, builder in enumerate(builders):
+            by_table.setdefault(id(builder._table), []).append(i)
+        results = [None] * len(builders)
+        for indices in by_table.values():
+            table = builders[indices[0]]._table
+            queries = [builders[i]._to_query() for i in indices]
+            result_sets = table._execute_queries(queries, batch_size)
+            for i, result_set in zip(indices, result_sets):
+                results[i] = builders[i]._rerank_result_set(result_set)
+        return results
+
+    def _to_query(self) -> Query:
+        vector = self._query
+        if isinstance(vector, list) and isinstance(vector[0], np.ndarray):
+            try:
+                # one contiguous (batch, dim) array rather than batch * dim floats
+                vector = np.stack(vector)
+            except ValueError:
+                # mismatched dimensions, leave reporting that to the query itself
+                vector = [v.tolist() for v in vector]
+        return Query(
             vector=vector,
             filter=self._where,
             prefilter=self._prefilter,
@@ -751,7 +900,10 @@ class LanceVectorQueryBuilder(LanceQueryBuilder):
             ef=self._ef,
             use_index=self._use_index,
         )
-        result_set = self._table._execute_query(query, batch_size)
+
+    def _rerank_result_set(
+        self, result_set: pa.RecordBatchReader
+    ) -> pa.RecordBatchReader:
         if self._reranker is not None:
             rs_table = result_set.read_all()
             result_set = self._reranker.rerank_vector(self._str_query, rs_table)
@@ -914,13 +1066,13 @@ class LanceFtsQueryBuilder(LanceQueryBuilder):
 
     def tantivy_to_arrow(self) -> pa.Table:
         try:
-            import tantivy
+            import tantivy  # noqa: F401
         except ImportError:
             raise ImportError(
                 "Please install tantivy-py `pip install tantivy` to use the full text search feature."  # noqa: E501
             )
 
-        from .fts import search_index
+        from .fts import open_index, search_index
 
         # get the index path
         path, fs, exist = self._table._get_fts_index_path()
@@ -940,7 +1092,7 @@ class LanceFtsQueryBuilder(LanceQueryBuilder):
                 "is only supported on the local filesystem"
             )
         # open the index
-        index = tantivy.Index.open(path)
+        index = open_index(path)
         # get the scores and doc ids
         query = self._query
         if self._phrase_query:
@@ -961,7 +1113,7 @@ class LanceFtsQueryBuilder(LanceQueryBuilder):
         if self._where is not None:
             tmp_name = "__lancedb__duckdb__indexer__"
             output_tbl = output_tbl.append_column(
-                tmp_name, pa.array(range(len(output_tbl)))
+                tmp_name, pa.array(np.arange(len(output_tbl), dtype=np.int64))
             )
             try:
                 # TODO would be great to have Substrait generate pyarrow compute
@@ -976,17 +1128,25 @@ class LanceFtsQueryBuilder(LanceQueryBuilder):
                 row_ids = row_ids.take(indexer)
 
             except ImportError:
-                import tempfile
-
-                import lance
-
-                # TODO Use "memory://" instead once that's supported
-                with tempfile.TemporaryDirectory() as tmp:
-                    ds = lance.write_dataset(output_tbl, tmp)
-                    output_tbl = ds.to_table(filter=self._where)
-                    indexer = output_tbl[tmp_name]
-                    row_ids = row_ids.take(indexer)
-                    output_tbl = output_tbl.drop([tmp_name])
+                # simple filters can be evaluated in memory by pyarrow
+                try:
+                    filtered = output_tbl.filter(sql_filter_to_expression(self._where))
+                except (ValueError, pa.ArrowException):
+                    # unsupported filter, or e.g. comparing columns with literals
+                    # of another type
+                    filtered = None
+                if filtered is None:
+                    import tempfile
+
+                    import lance
+
+                    # TODO Use "memory://" instead once that's supported
+                    with tempfile.TemporaryDirectory() as tmp:
+                        ds = lance.write_dataset(output_tbl, tmp)
+                        filtered = ds.to_table(filter=self._where)
+                indexer = filtered[tmp_name]
+                row_ids = row_ids.take(indexer)
+                output_tbl = filtered.drop([tmp_name])
 
         if self._with_row_id:
             output_tbl = output_tbl.append_column("_rowid", row_ids)
@@ -1072,6 +1232,8 @@ class LanceHybridQueryBuilder(LanceQueryBuilder):
         self._nprobes = None
         self._refine_factor = None
         self._metric = None
+        self._lower_bound = None
+        self._upper_bound = None
         self._phrase_query = False
 
     def _validate_query(self, query, vector=None, text=None):
@@ -1111,7 +1273,9 @@ class LanceHybridQueryBuilder(LanceQueryBuilder):
         self._phrase_query = phrase_query
         return self
 
-    def to_arrow(self) -> pa.Table:
+    def _materialize(self):
+        # the query options only live on this builder, they are copied to the
+        # two sub-queries once, right before they are executed
         vector_query, fts_query = self._validate_query(
             self._query, self._vector, self._text
         )
@@ -1121,6 +1285,9 @@ class LanceHybridQueryBuilder(LanceQueryBuilder):
         vector_query = self._query_to_vector(
             self._table, vector_query, self._vector_column
         )
+        if isinstance(vector_query, list):
+            # as in LanceQueryBuilder.create, so Query doesn't validate each float
+            vector_query = np.array(vector_query, dtype=np.float32)
         self._vector_query = LanceVectorQueryBuilder(
             self._table, vector_query, self._vector_column
         )
@@ -1145,18 +1312,24 @@ class LanceHybridQueryBuilder(LanceQueryBuilder):
             self._vector_query.nprobes(self._nprobes)
         if self._refine_factor:
             self._vector_query.refine_factor(self._refine_factor)
+        if self._lower_bound is not None or self._upper_bound is not None:
+            self._vector_query.distance_range(self._lower_bound, self._upper_bound)
         if self._ef:
             self._vector_query.ef(self._ef)
         if not self._use_index:
             self._vector_query.bypass_vector_index()
 
-        with ThreadPoolExecutor() as executor:
-            fts_future = executor.submit(self._fts_query.with_row_id(True).to_arrow)
-            vector_future = executor.submit(
-                self._vector_query.with_row_id(True).to_arrow
-            )
-            fts_results = fts_future.result()
-            vector_results = vector_future.result()
+    def to_arrow(self) -> pa.Table:
+        self._materialize()
+        fts_future = _HYBRID_POOL.submit(self._fts_query.with_row_id(True).to_arrow)
+        warm_up_future = None
+        if self._reranker is not None:
+            warm_up_future = _HYBRID_POOL.submit(self._reranker.warm_up)
+        # run the vector search on this thread rather than waiting on the pool
+        vector_results = self._vector_query.with_row_id(True).to_arrow()
+        fts_results = fts_future.result()
+        if warm_up_future is not None:
+            warm_up_future.result()
 
         return self._combine_hybrid_results(
             fts_results=fts_results,
@@ -1178,18 +1351,36 @@ class LanceHybridQueryBuilder(LanceQueryBuilder):
         limit: int,
         with_row_ids: bool,
     ) -> pa.Table:
-        if norm == "rank":
-            vector_results = LanceHybridQueryBuilder._rank(vector_results, "_distance")
-            fts_results = LanceHybridQueryBuilder._rank(fts_results, "_score")
+        if len(fts_results) == 0 and len(vector_results) == 0:
+            # nothing to rerank, so don't call into the reranker (which might
+            # run a model or a remote API) just to get an empty table back
+            schema = pa.unify_schemas([vector_results.schema, fts_results.schema])
+            results = schema.empty_table().append_column(
+                pa.field("_relevance_score", pa.float32()),
+                pa.array([], pa.float32()),
+            )
+            results = reranker._keep_relevance_score(results)
+            if not with_row_ids:
+                results = results.drop(["_rowid"])
+            return results
 
-        # normalize the scores to be between 0 and 1, 0 being most relevant
-        vector_results = LanceHybridQueryBuilder._normalize_scores(
-            vector_results, "_distance"
-        )
+        if norm == "rank":
+            vector_results = LanceHybridQueryBuilder._rank_normalize(
+                vector_results, "_distance"
+            )
+            fts_results = LanceHybridQueryBuilder._rank_normalize(fts_results, "_score")
+        else:
+            # normalize the scores to be between 0 and 1, 0 being most relevant
+            vector_results = LanceHybridQueryBuilder._normalize_scores(
+                vector_results, "_distance"
+            )
 
-        # In fts higher scores represent relevance. Not inverting them here as
-        # rerankers might need to preserve this score to support `return_score="all"`
-        fts_results = LanceHybridQueryBuilder._normalize_scores(fts_results, "_score")
+            # In fts higher scores represent relevance. Not inverting them here as
+            # rerankers might need to preserve this score to support
+            # `return_score="all"`
+            fts_results = LanceHybridQueryBuilder._normalize_scores(
+                fts_results, "_score"
+            )
 
         results = reranker.rerank_hybrid(fts_query, vector_results, fts_results)
 
@@ -1206,45 +1397,62 @@ class LanceHybridQueryBuilder(LanceQueryBuilder):
         raise NotImplementedError("to_batches not yet supported on a hybrid query")
 
     @staticmethod
-    def _rank(results: pa.Table, column: str, ascending: bool = True):
+    def _rank_normalize(results: pa.Table, column: str, ascending: bool = True):
+        """
+        Replace the scores with their ranks, normalized to be between 0 and 1.
+        This is what normalizing the 1-based ranks would give, in a single pass.
+        """
         if len(results) == 0:
             return results
-        # Get the _score column from results
-        scores = results.column(column).to_numpy()
-        sort_indices = np.argsort(scores)
-        if not ascending:
-            sort_indices = sort_indices[::-1]
-        ranks = np.empty_like(sort_indices)
-        ranks[sort_indices] = np.arange(len(scores)) + 1
+        if len(results) == 1:
+            # a single result is always first, no need to look at its score
+            ranks = np.zeros(1, dtype=np.float32)
+        else:
+            # Get the _score column from results
+            scores = results.column(column).to_numpy()
+            if not ascending:
+                scores = -scores
+            sort_indices = np.argsort(scores, kind="stable")
+            # build the ranks as float32 directly so pa.array can wrap the buffer
+            ranks = np.empty(len(scores), dtype=np.float32)
+            ranks[sort_indices] = _normalized_ranks(len(scores))
         # replace the _score column with the ranks
         _score_idx = results.column_names.index(column)
-        results = results.set_column(
-            _score_idx, column, pa.array(ranks, type=pa.float32())
-        )
+        results = results.set_column(_score_idx, column, pa.array(ranks))
         return results
 
     @staticmethod
     def _normalize_scores(results: pa.Table, column: str, invert=False):
         if len(results) == 0:
             return results
-        # Get the _score column from results
-        scores = results.column(column).to_numpy()
+        # Get the _score column from results as a fresh float32 copy, so
+        # everything below can work in place. The chunks are zero-copy views,
+        # so this is the only copy even when the column has several chunks.
+        scores = np.concatenate(
+            [chunk.to_numpy(zero_copy_only=False) for chunk in results[column].chunks],
+            dtype=np.float32,
+        )
         # normalize the scores by subtracting the min and dividing by the max
-        max, min = np.max(scores), np.min(scores)
-        if np.isclose(max, min):
-            rng = max
+        max, min = scores.max(), scores.min()
+        if max == min and np.isfinite(max):
+            # constant scores (e.g. a single row) all come out as 0
+            scores.fill(0)
         else:
-            rng = max - min
-        # If rng is 0 then min and max are both 0 and so we can leave the scores as is
-        if rng != 0:
-            scores = (scores - min) / rng
+            if np.isclose(max, min):
+                rng = max
+            else:
+                rng = max - min
+            # If rng is 0 then min and max are both 0 and so we can leave the
+            # scores as is
+            if rng != 0:
+                np.subtract(scores, min, out=scores)
+                np.divide(scores, rng, out=scores)
         if invert:
-            scores = 1 - scores
-        # replace the _score column with the ranks
+            np.subtract(1, scores, out=scores)
+        # replace the _score column with the ranks; pa.array wraps the
+        # contiguous float32 buffer without copying it
         _score_idx = results.column_names.index(column)
-        results = results.set_column(
-            _score_idx, column, pa.array(scores, type=pa.float32())
-        )
+        results = results.set_column(_score_idx, column, pa.array(scores))
         return results
 
     def rerank(
@@ -2159,25 +2367,25 @@ class AsyncHybridQuery(AsyncQueryBase):
         raise NotImplementedError("to_batches not yet supported on a hybrid query")
 
     async def to_arrow(self) -> pa.Table:
-        fts_query = AsyncFTSQuery(self._inner.to_fts_query())
-        vec_query = AsyncVectorQuery(self._inner.to_vector_query())
-
-        # save the row ID choice that was made on the query builder and force it
-        # to actually fetch the row ids because we need this for reranking
+        # save the row ID choice that was made on the query builder, both legs
+        # are executed with row ids because we need them for reranking
         with_row_ids = self._inner.get_with_row_id()
-        fts_query.with_row_id()
-        vec_query.with_row_id()
 
-        fts_results, vector_results = await asyncio.gather(
-            fts_query.to_arrow(),
-            vec_query.to_arrow(),
+        # both legs run concurrently behind a single native call
+        fts_stream, vec_stream = await self._inner.execute_legs()
+        fts_reader = AsyncRecordBatchReader(fts_stream)
+        vec_reader = AsyncRecordBatchReader(vec_stream)
+        fts_batches, vec_batches = await asyncio.gather(
+            fts_reader.read_all(), vec_reader.read_all()
         )
+        fts_results = pa.Table.from_batches(fts_batches, schema=fts_reader.schema)
+        vector_results = pa.Table.from_batches(vec_batches, schema=vec_reader.schema)
 
         return LanceHybridQueryBuilder._combine_hybrid_results(
             fts_results=fts_results,
             vector_results=vector_results,
             norm=self._norm,
-            fts_query=fts_query.get_query(),
+            fts_query=self._inner.to_fts_query().get_query(),
             reranker=self._reranker,
             limit=self._inner.get_limit(),
             with_row_ids=with_row_ids,
@@ -21,7 +21,6 @@ import warnings
 from lancedb import connect_async
 from lancedb.remote import ClientConfig
 import pyarrow as pa
-from overrides import override
 
 from ..common import DATA
 from ..db import DBConnection, LOOP
@@ -101,7 +100,6 @@ class RemoteDBConnection(DBConnection):
     def __repr__(self) -> str:
         return f"RemoteConnect(name={self.db_name})"
 
-    @override
     def table_names(
         self, page_token: Optional[str] = None, limit: int = 10
     ) -> Iterable[str]:
@@ -120,7 +118,6 @@ class RemoteDBConnection(DBConnection):
         """
         return LOOP.run(self._conn.table_names(start_after=page_token, limit=limit))
 
-    @override
     def open_table(
         self,
         name: str,
@@ -150,7 +147,6 @@ class RemoteDBConnection(DBConnection):
         table = LOOP.run(self._conn.open_table(name))
         return RemoteTable(table, self.db_name)
 
-    @override
     def create_table(
         self,
         name: str,
@@ -275,7 +271,6 @@ class RemoteDBConnection(DBConnection):
         )
         return RemoteTable(table, self.db_name)
 
-    @override
     def drop_table(self, name: str):
         """Drop a table from the database.
 
@@ -286,7 +281,6 @@ class RemoteDBConnection(DBConnection):
         """
         LOOP.run(self._conn.drop_table(name))
 
-    @override
     def rename_table(self, cur_name: str, new_name: str):
         """Rename a table in the database.
 
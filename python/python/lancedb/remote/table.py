@@ -1,16 +1,19 @@
 # SPDX-License-Identifier: Apache-2.0
 # SPDX-FileCopyrightText: Copyright The LanceDB Authors
 
+import asyncio
 from datetime import timedelta
 import logging
 from functools import cached_property
-from typing import Dict, Iterable, List, Optional, Union, Literal
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union, Literal
 import warnings
 
 from lancedb._lancedb import IndexConfig
 from lancedb.embeddings.base import EmbeddingFunctionConfig
 from lancedb.index import FTS, BTree, Bitmap, HnswPq, HnswSq, IvfFlat, IvfPq, LabelList
 from lancedb.remote.db import LOOP
+import numpy as np
 import pyarrow as pa
 
 from lancedb.common import DATA, VEC, VECTOR_COLUMN_NAME
@@ -21,6 +24,30 @@ from ..query import LanceVectorQueryBuilder, LanceQueryBuilder
 from ..table import AsyncTable, IndexStatistics, Query, Table
 
 
+# How long a fetched schema is reused before asking the server again. Schema
+# changes made through this object take effect immediately regardless.
+SCHEMA_CACHE_TTL = timedelta(seconds=30)
+# How long len(table) reuses the last row count. Writes made through this
+# object take effect immediately regardless.
+ROW_COUNT_CACHE_TTL = timedelta(seconds=1)
+
+# Index config classes by the index_type names accepted by create_scalar_index
+# and create_index
+_SCALAR_INDEX_TYPES = {
+    "scalar": BTree,
+    "BTREE": BTree,
+    "BITMAP": Bitmap,
+    "LABEL_LIST": LabelList,
+}
+_VECTOR_INDEX_TYPES = {
+    "VECTOR": IvfPq,
+    "IVF_PQ": IvfPq,
+    "IVF_HNSW_PQ": HnswPq,
+    "IVF_HNSW_SQ": HnswSq,
+    "IVF_FLAT": IvfFlat,
+}
+
+
 class RemoteTable(Table):
     def __init__(
         self,
@@ -29,6 +56,10 @@ class RemoteTable(Table):
     ):
         self._table = table
         self.db_name = db_name
+        # (time.monotonic() of the fetch, schema)
+        self._schema_cache: Optional[Tuple[float, pa.Schema]] = None
+        # (time.monotonic() of the count, number of rows)
+        self._row_count_cache: Optional[Tuple[float, int]] = None
 
     @property
     def name(self) -> str:
@@ -39,7 +70,13 @@ class RemoteTable(Table):
         return f"RemoteTable({self.db_name}.{self.name})"
 
     def __len__(self) -> int:
-        self.count_rows(None)
+        now = time.monotonic()
+        cached = self._row_count_cache
+        if cached is not None and now - cached[0] < ROW_COUNT_CACHE_TTL.total_seconds():
+            return cached[1]
+        count = self.count_rows(None)
+        self._row_count_cache = (now, count)
+        return count
 
     @property
     def schema(self) -> pa.Schema:
@@ -47,7 +84,19 @@ class RemoteTable(Table):
         of this Table
 
         """
-        return LOOP.run(self._table.schema())
+        now = time.monotonic()
+        cached = self._schema_cache
+        if cached is not None and now - cached[0] < SCHEMA_CACHE_TTL.total_seconds():
+            return cached[1]
+        schema = LOOP.run(self._table.schema())
+        self._schema_cache = (now, schema)
+        return schema
+
+    def _invalidate_schema(self):
+        self._schema_cache = None
+
+    def _invalidate_row_count(self):
+        self._row_count_cache = None
 
     @property
     def version(self) -> int:
@@ -82,10 +131,16 @@ class RemoteTable(Table):
         return NotImplementedError("to_pandas() is not yet supported on LanceDB cloud.")
 
     def checkout(self, version: int):
-        return LOOP.run(self._table.checkout(version))
+        result = LOOP.run(self._table.checkout(version))
+        self._invalidate_schema()
+        self._invalidate_row_count()
+        return result
 
     def checkout_latest(self):
-        return LOOP.run(self._table.checkout_latest())
+        result = LOOP.run(self._table.checkout_latest())
+        self._invalidate_schema()
+        self._invalidate_row_count()
+        return result
 
     def list_indices(self) -> Iterable[IndexConfig]:
         """List all the indices on the table"""
@@ -114,14 +169,11 @@ class RemoteTable(Table):
         replace : bool
             If True, replace the existing index with the new one.
         """
-        if index_type == "scalar" or index_type == "BTREE":
-            config = BTree()
-        elif index_type == "BITMAP":
-            config = Bitmap()
-        elif index_type == "LABEL_LIST":
-            config = LabelList()
-        else:
-            raise ValueError(f"Unknown index type: {index_type}")
+        try:
+            config_cls = _SCALAR_INDEX_TYPES[index_type]
+        except KeyError:
+            raise ValueError(f"Unknown index type: {index_type}") from None
+        config = config_cls()
 
         LOOP.run(self._table.create_index(column, config=config, replace=replace))
 
@@ -219,19 +271,14 @@ class RemoteTable(Table):
             )
 
         index_type = index_type.upper()
-        if index_type == "VECTOR" or index_type == "IVF_PQ":
-            config = IvfPq(distance_type=metric)
-        elif index_type == "IVF_HNSW_PQ":
-            config = HnswPq(distance_type=metric)
-        elif index_type == "IVF_HNSW_SQ":
-            config = HnswSq(distance_type=metric)
-        elif index_type == "IVF_FLAT":
-            config = IvfFlat(distance_type=metric)
-        else:
+        try:
+            config_cls = _VECTOR_INDEX_TYPES[index_type]
+        except KeyError:
             raise ValueError(
                 f"Unknown vector index type: {index_type}. Valid options are"
                 " 'IVF_FLAT', 'IVF_PQ', 'IVF_HNSW_PQ', 'IVF_HNSW_SQ'"
-            )
+            ) from None
+        config = config_cls(distance_type=metric)
 
         LOOP.run(self._table.create_index(vector_column_name, config=config))
 
@@ -264,12 +311,15 @@ class RemoteTable(Table):
         fill_value: float, default 0.
             The value to use when filling vectors. Only used if on_bad_vectors="fill".
 
+        Each call is a separate round trip to the server. To send many small
+        writes at once, see [bulk][lancedb.remote.table.RemoteTable.bulk].
         """
         LOOP.run(
             self._table.add(
                 data, mode=mode, on_bad_vectors=on_bad_vectors, fill_value=fill_value
             )
         )
+        self._invalidate_row_count()
 
     def search(
         self,
@@ -355,6 +405,11 @@ class RemoteTable(Table):
     ) -> pa.RecordBatchReader:
         return LOOP.run(self._table._execute_query(query, batch_size=batch_size))
 
+    def _execute_queries(
+        self, queries: List[Query], batch_size: Optional[int] = None
+    ) -> List[pa.RecordBatchReader]:
+        return LOOP.run(self._table._execute_queries(queries, batch_size=batch_size))
+
     def merge_insert(self, on: Union[str, Iterable[str]]) -> LanceMergeInsertBuilder:
         """Returns a [`LanceMergeInsertBuilder`][lancedb.merge.LanceMergeInsertBuilder]
         that can be used to create a "merge insert" operation.
@@ -371,6 +426,7 @@ class RemoteTable(Table):
         fill_value: float,
     ):
         LOOP.run(self._table._do_merge(merge, new_data, on_bad_vectors, fill_value))
+        self._invalidate_row_count()
 
     def delete(self, predicate: str):
         """Delete rows from the table.
@@ -418,8 +474,12 @@ class RemoteTable(Table):
         >>> table.search([10,10]).to_pandas() # doctest: +SKIP
            x      vector  _distance # doctest: +SKIP
         0  2  [3.0, 4.0]       85.0 # doctest: +SKIP
+
+        Many deletes can be sent at once with
+        [bulk][lancedb.remote.table.RemoteTable.bulk].
         """
         LOOP.run(self._table.delete(predicate))
+        self._invalidate_row_count()
 
     def update(
         self,
@@ -468,11 +528,72 @@ class RemoteTable(Table):
         1  3    [5.0, 6.0] # doctest: +SKIP
         2  2  [10.0, 10.0] # doctest: +SKIP
 
+        Many updates can be sent at once with
+        [bulk][lancedb.remote.table.RemoteTable.bulk].
         """
         LOOP.run(
             self._table.update(where=where, updates=values, updates_sql=values_sql)
         )
 
+    def bulk(self, ops: Iterable[Tuple[str, tuple, dict]]) -> List[Any]:
+        """Run many `add`, `delete` and `update` calls concurrently.
+
+        Calling these methods in a Python loop waits for each request to
+        finish before sending the next one. `bulk` hands all of them to the
+        background event loop at once, so the requests overlap.
+
+        Parameters
+        ----------
+        ops: Iterable[Tuple[str, tuple, dict]]
+            The operations to run, as `(method_name, args, kwargs)` tuples.
+            `method_name` is one of "add", "delete" or "update", and the
+            arguments are the same as for the method of that name.
+
+        Returns
+        -------
+        List[Any]
+            One entry per operation, in the same order as `ops`. Failed
+            operations are returned as their exception rather than raised,
+            so one failure does not hide the outcome of the others.
+
+        Notes
+        -----
+        The operations may be applied in any order. Don't use `bulk` for
+        operations that depend on each other, such as an `update` of rows
+        added by an `add` in the same batch.
+
+        Examples
+        --------
+        >>> table.bulk([ # doctest: +SKIP
+        ...     ("delete", ("x = 1",), {}),
+        ...     ("update", (), {"where": "x = 2", "values": {"x": 20}}),
+        ... ])
+        [None, None]
+        """
+        ops = list(ops)
+        for name, _, _ in ops:
+            if name not in _BULK_OPS:
+                raise ValueError(
+                    f"Unsupported bulk operation '{name}', expected one of "
+                    f"{list(_BULK_OPS)}"
+                )
+
+        coros = []
+        try:
+            for name, args, kwargs in ops:
+                coros.append(_BULK_OPS[name](self._table, *args, **kwargs))
+        except Exception:
+            for coro in coros:
+                coro.close()
+            raise
+
+        async def run_all():
+            return await asyncio.gather(*coros, return_exceptions=True)
+
+        results = LOOP.run(run_all())
+        self._invalidate_row_count()
+        return results
+
     def cleanup_old_versions(self, *_):
         """
         cleanup_old_versions() is a no-op on LanceDB Cloud.
@@ -518,13 +639,19 @@ class RemoteTable(Table):
         return LOOP.run(self._table.count_rows(filter))
 
     def add_columns(self, transforms: Dict[str, str]):
-        return LOOP.run(self._table.add_columns(transforms))
+        result = LOOP.run(self._table.add_columns(transforms))
+        self._invalidate_schema()
+        return result
 
     def alter_columns(self, *alterations: Iterable[Dict[str, str]]):
-        return LOOP.run(self._table.alter_columns(*alterations))
+        result = LOOP.run(self._table.alter_columns(*alterations))
+        self._invalidate_schema()
+        return result
 
     def drop_columns(self, columns: Iterable[str]):
-        return LOOP.run(self._table.drop_columns(columns))
+        result = LOOP.run(self._table.drop_columns(columns))
+        self._invalidate_schema()
+        return result
 
     def uses_v2_manifest_paths(self) -> bool:
         raise NotImplementedError(
@@ -537,9 +664,44 @@ class RemoteTable(Table):
         )
 
 
+def _bulk_add(
+    table: AsyncTable,
+    data: DATA,
+    mode: str = "append",
+    on_bad_vectors: str = "error",
+    fill_value: float = 0.0,
+):
+    return table.add(
+        data, mode=mode, on_bad_vectors=on_bad_vectors, fill_value=fill_value
+    )
+
+
+def _bulk_delete(table: AsyncTable, predicate: str):
+    return table.delete(predicate)
+
+
+def _bulk_update(
+    table: AsyncTable,
+    where: Optional[str] = None,
+    values: Optional[dict] = None,
+    *,
+    values_sql: Optional[Dict[str, str]] = None,
+):
+    return table.update(where=where, updates=values, updates_sql=values_sql)
+
+
+# Operations accepted by RemoteTable.bulk, mapping the sync method signature
+# onto the AsyncTable call
+_BULK_OPS = {
+    "add": _bulk_add,
+    "delete": _bulk_delete,
+    "update": _bulk_update,
+}
+
+
 def add_index(tbl: pa.Table, i: int) -> pa.Table:
     return tbl.add_column(
         0,
         pa.field("query_index", pa.uint32()),
-        pa.array([i] * len(tbl), pa.uint32()),
+        pa.array(np.full(len(tbl), i, dtype=np.uint32)),
     )
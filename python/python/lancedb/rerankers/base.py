@@ -49,6 +49,14 @@ class Reranker(ABC):
         if ARROW_VERSION.major <= 13:
             self._concat_tables_args = {"promote": True}
 
+    def warm_up(self):
+        """
+        Load any model or client the reranker needs ahead of time. Hybrid search
+        calls this while the vector and FTS searches are running so that loading
+        overlaps with them. Does nothing by default.
+        """
+        pass
+
     def rerank_vector(
         self,
         query: str,
@@ -194,7 +202,10 @@ class Reranker(ABC):
 
         # avoids circular import
         if type(vector_results[0]).__name__ == "LanceVectorQueryBuilder":
-            vector_results = [result.to_arrow() for result in vector_results]
+            from ..query import LanceVectorQueryBuilder
+
+            result_sets = LanceVectorQueryBuilder.to_batches_many(vector_results)
+            vector_results = [result_set.read_all() for result_set in result_sets]
         elif not isinstance(vector_results[0], pa.Table):
             raise ValueError(
                 "vector_results should be a list of pa.Table or LanceVectorQueryBuilder"
@@ -71,6 +71,9 @@ class CrossEncoderReranker(Reranker):
 
         return cross_encoder
 
+    def warm_up(self):
+        self.model
+
     def _rerank(self, result_set: pa.Table, query: str):
         passages = result_set[self.column].to_pylist()
         cross_inp = [[query, passage] for passage in passages]
@@ -11,8 +11,9 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from numpy import nan
+import numpy as np
 import pyarrow as pa
+import pyarrow.compute as pc
 
 from .base import Reranker
 
@@ -63,15 +64,13 @@ class LinearCombinationReranker(Reranker):
         # column equal the existing vector or fts score
         if len(vector_results) == 0:
             results = fts_results.append_column(
-                "_relevance_score",
-                pa.array(fts_results["_score"], type=pa.float32()),
+                "_relevance_score", fts_results["_score"].cast(pa.float32())
             )
             if self.score == "relevance":
                 results = self._keep_relevance_score(results)
             elif self.score == "all":
                 results = results.append_column(
-                    "_distance",
-                    pa.array([nan] * len(fts_results), type=pa.float32()),
+                    "_distance", pa.array(np.full(len(fts_results), np.nan, np.float32))
                 )
             return results
 
@@ -79,59 +78,51 @@ class LinearCombinationReranker(Reranker):
             # invert the distance to relevance score
             results = vector_results.append_column(
                 "_relevance_score",
-                pa.array(
-                    [
-                        self._invert_score(distance)
-                        for distance in vector_results["_distance"].to_pylist()
-                    ],
-                    type=pa.float32(),
-                ),
+                pc.subtract(1, vector_results["_distance"]).cast(pa.float32()),
             )
             if self.score == "relevance":
                 results = self._keep_relevance_score(results)
             elif self.score == "all":
                 results = results.append_column(
-                    "_score",
-                    pa.array([nan] * len(vector_results), type=pa.float32()),
+                    "_score", pa.array(np.full(len(vector_results), np.nan, np.float32))
                 )
             return results
 
-        # sort both input tables on _rowid
-        combined_list = []
-        vector_list = vector_results.sort_by("_rowid").to_pylist()
-        fts_list = fts_results.sort_by("_rowid").to_pylist()
-        i, j = 0, 0
-        while i < len(vector_list):
-            if j >= len(fts_list):
-                for vi in vector_list[i:]:
-                    vi["_relevance_score"] = self._combine_score(vi["_distance"], fill)
-                    combined_list.append(vi)
-                break
+        # locate each vector result's row id among the fts results
+        vector_ids = vector_results["_rowid"].to_numpy()
+        fts_ids = fts_results["_rowid"].to_numpy()
+        fts_order = np.argsort(fts_ids, kind="stable")
+        fts_idx = np.searchsorted(fts_ids, vector_ids, sorter=fts_order)
+        fts_idx = fts_order[np.minimum(fts_idx, len(fts_ids) - 1)]
+        matched = fts_ids[fts_idx] == vector_ids
+        fts_only = ~np.isin(fts_ids, vector_ids)
 
-            vi = vector_list[i]
-            fj = fts_list[j]
-            # invert the fts score from relevance to distance
-            inverted_fts_score = self._invert_score(fj["_score"])
-            if vi["_rowid"] == fj["_rowid"]:
-                vi["_relevance_score"] = self._combine_score(
-                    vi["_distance"], inverted_fts_score
-                )
-                vi["_score"] = fj["_score"]  # keep the original score
-                combined_list.append(vi)
-                i += 1
-                j += 1
-            elif vector_list[i]["_rowid"] < fts_list[j]["_rowid"]:
-                vi["_relevance_score"] = self._combine_score(vi["_distance"], fill)
-                combined_list.append(vi)
-                i += 1
-            else:
-                fj["_relevance_score"] = self._combine_score(inverted_fts_score, fill)
-                combined_list.append(fj)
-                j += 1
-        if j < len(fts_list) - 1:
-            for fj in fts_list[j:]:
-                fj["_relevance_score"] = self._combine_score(inverted_fts_score, fill)
-                combined_list.append(fj)
+        # invert the fts score from relevance to distance
+        inverted_fts_scores = self._invert_score(
+            fts_results["_score"].to_numpy().astype(np.float64)
+        )
+        # the rows are the vector results followed by the rows only found by
+        # fts, whose scores are combined in a single vectorized evaluation
+        vector_scores = np.concatenate(
+            [
+                vector_results["_distance"].to_numpy().astype(np.float64),
+                inverted_fts_scores[fts_only],
+            ]
+        )
+        fts_scores = np.full(len(vector_scores), fill, dtype=np.float64)
+        fts_scores[: len(vector_ids)][matched] = inverted_fts_scores[fts_idx[matched]]
+        relevance_scores = self._combine_score(vector_scores, fts_scores)
+
+        # keep the original fts score of rows found by vector search, if any
+        vector_rows = vector_results.append_column(
+            "_score",
+            fts_results["_score"].take(pa.array(fts_idx, mask=~matched)),
+        )
+        fts_rows = fts_results.filter(fts_only)
+        fts_rows = fts_rows.append_column(
+            "_distance",
+            pa.nulls(len(fts_rows), vector_results.schema.field("_distance").type),
+        )
 
         relevance_score_schema = pa.schema(
             [
@@ -141,8 +132,14 @@ class LinearCombinationReranker(Reranker):
         combined_schema = pa.unify_schemas(
             [vector_results.schema, fts_results.schema, relevance_score_schema]
         )
-        tbl = pa.Table.from_pylist(combined_list, schema=combined_schema).sort_by(
-            [("_relevance_score", "descending")]
+        tbl = (
+            pa.concat_tables([vector_rows, fts_rows], **self._concat_tables_args)
+            .append_column(
+                "_relevance_score", pa.array(relevance_scores.astype(np.float32))
+            )
+            .select(combined_schema.names)
+            .cast(combined_schema)
+            .sort_by([("_relevance_score", "descending"), ("_rowid", "ascending")])
         )
         if self.score == "relevance":
             tbl = self._keep_relevance_score(tbl)
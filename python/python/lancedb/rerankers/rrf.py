@@ -12,9 +12,9 @@
 #  limitations under the License.
 
 from typing import Union, List, TYPE_CHECKING
+import numpy as np
 import pyarrow as pa
 
-from collections import defaultdict
 from .base import Reranker
 
 if TYPE_CHECKING:
@@ -51,24 +51,31 @@ class RRFReranker(Reranker):
         vector_results: pa.Table,
         fts_results: pa.Table,
     ):
-        vector_ids = vector_results["_rowid"].to_pylist() if vector_results else []
-        fts_ids = fts_results["_rowid"].to_pylist() if fts_results else []
-        rrf_score_map = defaultdict(float)
-
-        # Calculate RRF score of each result
-        for ids in [vector_ids, fts_ids]:
-            for i, result_id in enumerate(ids, 1):
-                rrf_score_map[result_id] += 1 / (i + self.K)
-
-        # Sort the results based on RRF score
-        combined_results = self.merge_results(vector_results, fts_results)
-        combined_row_ids = combined_results["_rowid"].to_pylist()
-        relevance_scores = [rrf_score_map[row_id] for row_id in combined_row_ids]
-        combined_results = combined_results.append_column(
-            "_relevance_score", pa.array(relevance_scores, type=pa.float32())
+        combined_results = pa.concat_tables(
+            [vector_results, fts_results], **self._concat_tables_args
         )
-        combined_results = combined_results.sort_by(
-            [("_relevance_score", "descending")]
+        row_ids = combined_results["_rowid"].to_numpy()
+        ranks = np.concatenate(
+            [np.arange(1, len(vector_results) + 1), np.arange(1, len(fts_results) + 1)]
+        )
+
+        # Calculate RRF score of each result, summing 1 / (rank + K) over
+        # every leg the row id appears in
+        unique_ids, first_idx, inverse = np.unique(
+            row_ids, return_index=True, return_inverse=True
+        )
+        rrf_scores = np.bincount(
+            inverse, weights=1 / (ranks + self.K), minlength=len(unique_ids)
+        )
+
+        # Keep the first occurrence of each row id, sorted by RRF score. Ties
+        # keep their order in the concatenated results. The wide columns are
+        # only gathered once, by the final take.
+        keep = np.sort(first_idx)
+        relevance_scores = rrf_scores[inverse[keep]].astype(np.float32)
+        order = np.argsort(-relevance_scores, kind="stable")
+        combined_results = combined_results.take(keep[order]).append_column(
+            "_relevance_score", pa.array(relevance_scores[order])
         )
 
         if self.score == "relevance":
@@ -96,7 +103,10 @@ class RRFReranker(Reranker):
 
         # avoid circular import
         if type(vector_results[0]).__name__ == "LanceVectorQueryBuilder":
-            vector_results = [result.to_arrow() for result in vector_results]
+            from ..query import LanceVectorQueryBuilder
+
+            result_sets = LanceVectorQueryBuilder.to_batches_many(vector_results)
+            vector_results = [result_set.read_all() for result_set in result_sets]
         elif not isinstance(vector_results[0], pa.Table):
             raise ValueError(
                 "vector_results should be a list of pa.Table or LanceVectorQueryBuilder"
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import inspect
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
@@ -23,6 +24,7 @@ from typing import (
 from urllib.parse import urlparse
 
 import lance
+import numpy as np
 from lancedb.background_loop import LOOP
 from .dependencies import _check_for_pandas
 import pyarrow as pa
@@ -31,12 +33,14 @@ import pyarrow.fs as pa_fs
 from lance import LanceDataset
 from lance.dependencies import _check_for_hugging_face
 
+from .arrow import _to_prefetching_reader
 from .common import DATA, VEC, VECTOR_COLUMN_NAME
 from .embeddings import EmbeddingFunctionConfig, EmbeddingFunctionRegistry
 from .index import BTree, IvfFlat, IvfPq, Bitmap, LabelList, HnswPq, HnswSq, FTS
 from .merge import LanceMergeInsertBuilder
 from .pydantic import LanceModel, model_to_dict
 from .query import (
+    AsyncHybridQuery,
     AsyncQuery,
     AsyncVectorQuery,
     LanceEmptyQueryBuilder,
@@ -98,6 +102,8 @@ def _into_pyarrow_table(data) -> pa.Table:
             return pa.Table.from_pylist(data, schema=schema)
         elif isinstance(data[0], pa.RecordBatch):
             return pa.Table.from_batches(data)
+        elif isinstance(data[0], dict):
+            return _table_from_dicts(data)
         else:
             return pa.Table.from_pylist(data)
     elif _check_for_pandas(data) and isinstance(data, pd.DataFrame):
@@ -165,6 +171,11 @@ def _iterator_to_table(data: Iterable) -> pa.Table:
         raise ValueError("Input iterable is empty")
 
 
+# Inputs to AsyncTable.add larger than this are sanitized in slices of about
+# this many bytes, see _sanitize_data_reader
+_SANITIZE_CHUNK_BYTES = 64 * 1024 * 1024
+
+
 def _sanitize_data(
     data: "DATA",
     target_schema: Optional[pa.Schema] = None,
@@ -233,6 +244,48 @@ def _sanitize_data(
     return table
 
 
+def _sanitize_data_reader(
+    data: "DATA",
+    target_schema: Optional[pa.Schema] = None,
+    metadata: Optional[dict] = None,  # embedding metadata
+    on_bad_vectors: Literal["error", "drop", "fill", "null"] = "error",
+    fill_value: float = 0.0,
+    *,
+    allow_subschema: bool = False,
+) -> pa.RecordBatchReader:
+    """
+    Like `_sanitize_data`, but return a reader that sanitizes large inputs one
+    slice at a time as the writer consumes it.
+
+    This lets computing embeddings and casting for one slice overlap with
+    writing or uploading the previous one. The first slice is sanitized
+    before returning, so schema errors are still raised here.
+    """
+    table = _into_pyarrow_table(data)
+    kwargs = dict(
+        target_schema=target_schema,
+        metadata=metadata,
+        on_bad_vectors=on_bad_vectors,
+        fill_value=fill_value,
+        allow_subschema=allow_subschema,
+    )
+    if table.nbytes <= _SANITIZE_CHUNK_BYTES:
+        return _sanitize_data(table, **kwargs).to_reader()
+
+    rows_per_chunk = max(1, len(table) * _SANITIZE_CHUNK_BYTES // table.nbytes)
+    first = _sanitize_data(table.slice(0, rows_per_chunk), **kwargs)
+
+    def batches():
+        yield from first.to_batches()
+        for offset in range(rows_per_chunk, len(table), rows_per_chunk):
+            chunk = _sanitize_data(table.slice(offset, rows_per_chunk), **kwargs)
+            if chunk.schema != first.schema:
+                chunk = chunk.cast(first.schema)
+            yield from chunk.to_batches()
+
+    return pa.RecordBatchReader.from_batches(first.schema, batches())
+
+
 def _cast_to_target_schema(
     table: pa.Table,
     target_schema: pa.Schema,
@@ -314,6 +367,11 @@ def sanitize_create_table(
     on_bad_vectors: str = "error",
     fill_value: float = 0.0,
 ):
+    """
+    Convert the data for a new table into a pa.Table with a validated schema.
+
+    Returns the table (None if only a schema was given) and its schema.
+    """
     if inspect.isclass(schema) and issubclass(schema, LanceModel):
         # convert LanceModel to pyarrow schema
         # note that it's possible this contains
@@ -331,23 +389,56 @@ def sanitize_create_table(
             fill_value=fill_value,
         )
         schema = data.schema
-    else:
-        if schema is not None:
-            data = pa.Table.from_pylist([], schema)
-    if schema is None:
-        if data is None:
-            raise ValueError("Either data or schema must be provided")
-        elif hasattr(data, "schema"):
-            schema = data.schema
+    elif schema is None:
+        raise ValueError("Either data or schema must be provided")
 
     if metadata:
         schema = schema.with_metadata(metadata)
-        # Need to apply metadata to the data as well
-        data = data.replace_schema_metadata(metadata)
+        if data is not None:
+            # Need to apply metadata to the data as well
+            data = data.replace_schema_metadata(metadata)
+
+    _validate_schema(schema)
 
     return data, schema
 
 
+def _table_from_dicts(data: List[dict]) -> pa.Table:
+    """
+    Equivalent to pa.Table.from_pylist, but numpy vectors are stacked
+    into a single buffer instead of being converted row by row.
+    """
+    columns = {name: [row.get(name) for row in data] for name in data[0]}
+    if not any(isinstance(col[0], np.ndarray) for col in columns.values()):
+        return pa.Table.from_pylist(data)
+    for name, col in columns.items():
+        arr = _stack_numpy_vectors(col)
+        if arr is not None:
+            columns[name] = arr
+    return pa.Table.from_pydict(columns)
+
+
+def _stack_numpy_vectors(values: list) -> Optional[pa.ListArray]:
+    first = values[0]
+    if (
+        not isinstance(first, np.ndarray)
+        or first.ndim != 1
+        or first.dtype.kind not in "iuf"
+    ):
+        return None
+    shape, dtype = first.shape, first.dtype
+    for v in values:
+        if not isinstance(v, np.ndarray) or v.shape != shape or v.dtype != dtype:
+            return None
+    dim = shape[0]
+    if len(values) * dim >= 2**31:
+        # too large for 32-bit list offsets
+        return None
+    flat = pa.array(np.stack(values).ravel())
+    offsets = pa.array(np.arange(0, len(values) * dim + 1, dim, dtype=np.int32))
+    return pa.ListArray.from_arrays(offsets, flat)
+
+
 def _schema_from_hf(data, schema):
     """
     Extract pyarrow schema from HuggingFace DatasetDict
@@ -904,6 +995,11 @@ class Table(ABC):
         self, query: Query, batch_size: Optional[int] = None
     ) -> pa.RecordBatchReader: ...
 
+    def _execute_queries(
+        self, queries: List[Query], batch_size: Optional[int] = None
+    ) -> List[pa.RecordBatchReader]:
+        return [self._execute_query(query, batch_size) for query in queries]
+
     @abstractmethod
     def _do_merge(
         self,
@@ -2066,21 +2162,24 @@ class LanceTable(Table):
         self = cls.__new__(cls)
         self._conn = db
 
-        self._table = LOOP.run(
-            self._conn._conn.create_table(
-                name,
-                data,
-                schema=schema,
-                mode=mode,
-                exist_ok=exist_ok,
-                on_bad_vectors=on_bad_vectors,
-                fill_value=fill_value,
-                embedding_functions=embedding_functions,
-                storage_options=storage_options,
-                data_storage_version=data_storage_version,
-                enable_v2_manifest_paths=enable_v2_manifest_paths,
+        try:
+            self._table = LOOP.run(
+                self._conn._conn.create_table(
+                    name,
+                    data,
+                    schema=schema,
+                    mode=mode,
+                    exist_ok=exist_ok,
+                    on_bad_vectors=on_bad_vectors,
+                    fill_value=fill_value,
+                    embedding_functions=embedding_functions,
+                    storage_options=storage_options,
+                    data_storage_version=data_storage_version,
+                    enable_v2_manifest_paths=enable_v2_manifest_paths,
+                )
             )
-        )
+        finally:
+            db._invalidate_table_names()
         return self
 
     def delete(self, where: str):
@@ -2137,6 +2236,11 @@ class LanceTable(Table):
     ) -> pa.RecordBatchReader:
         return LOOP.run(self._table._execute_query(query, batch_size))
 
+    def _execute_queries(
+        self, queries: List[Query], batch_size: Optional[int] = None
+    ) -> List[pa.RecordBatchReader]:
+        return LOOP.run(self._table._execute_queries(queries, batch_size))
+
     def _do_merge(
         self,
         merge: LanceMergeInsertBuilder,
@@ -2751,7 +2855,7 @@ class AsyncTable:
             on_bad_vectors = "error"
         if fill_value is None:
             fill_value = 0.0
-        data = _sanitize_data(
+        data = _sanitize_data_reader(
             data,
             schema,
             metadata=schema.metadata,
@@ -2759,8 +2863,6 @@ class AsyncTable:
             fill_value=fill_value,
             allow_subschema=True,
         )
-        if isinstance(data, pa.Table):
-            data = data.to_reader()
 
         await self._inner.add(data, mode or "append")
 
@@ -2855,11 +2957,15 @@ class AsyncTable:
         if query.with_row_id:
             async_query = async_query.with_row_id()
 
-        if query.vector:
+        if len(query.vector) > 0:
+            vector = query.vector
+            if isinstance(vector, np.ndarray) and vector.ndim > 1:
+                # one query per row, the rows are views so nothing is copied
+                vector = list(vector)
             # we need the schema to get the vector column type
             # to determine whether the vectors is batch queries or not
             async_query = (
-                async_query.nearest_to(query.vector)
+                async_query.nearest_to(vector)
                 .distance_type(query.metric)
                 .nprobes(query.nprobes)
                 .distance_range(query.lower_bound, query.upper_bound)
@@ -2883,8 +2989,20 @@ class AsyncTable:
             fts_columns = query.full_text_query.get("columns", []) or []
             async_query = async_query.nearest_to_text(fts_query, columns=fts_columns)
 
-        table = await async_query.to_arrow()
-        return table.to_reader()
+        if isinstance(async_query, AsyncHybridQuery):
+            table = await async_query.to_arrow()
+            return table.to_reader()
+        # stream the batches to the caller instead of collecting them first
+        stream = await async_query.to_batches()
+        return _to_prefetching_reader(stream, asyncio.get_running_loop())
+
+    async def _execute_queries(
+        self, queries: List[Query], batch_size: Optional[int] = None
+    ) -> List[pa.RecordBatchReader]:
+        # run the queries concurrently, so their round trips overlap
+        return await asyncio.gather(
+            *[self._execute_query(query, batch_size) for query in queries]
+        )
 
     async def _do_merge(
         self,
@@ -6,14 +6,16 @@ import functools
 import importlib
 import os
 import pathlib
+import re
 import warnings
 from datetime import date, datetime
 from functools import singledispatch
-from typing import Tuple, Union, Optional, Any
+from typing import List, Tuple, Union, Optional, Any
 from urllib.parse import urlparse
 
 import numpy as np
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.fs as pa_fs
 
 from ._lancedb import validate_table_name as native_validate_table_name
@@ -31,6 +33,13 @@ def safe_import_adlfs():
 adlfs = safe_import_adlfs()
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_uri(uri: str):
+    # ParseResult is an immutable namedtuple, so it is safe to share between callers
+    return urlparse(uri)
+
+
+@functools.lru_cache(maxsize=1024)
 def get_uri_scheme(uri: str) -> str:
     """
     Get the scheme of a URI. If the URI does not have a scheme, assume it is a file URI.
@@ -44,7 +53,7 @@ def get_uri_scheme(uri: str) -> str:
     -------
     str: The scheme of the URI.
     """
-    parsed = urlparse(uri)
+    parsed = _parse_uri(uri)
     scheme = parsed.scheme
     if not scheme:
         scheme = "file"
@@ -58,6 +67,7 @@ def get_uri_scheme(uri: str) -> str:
     return scheme
 
 
+@functools.lru_cache(maxsize=1024)
 def get_uri_location(uri: str) -> str:
     """
     Get the location of a URI. If the parameter is not a url, assumes it is just a path
@@ -71,7 +81,7 @@ def get_uri_location(uri: str) -> str:
     -------
     str: Location part of the URL, without scheme
     """
-    parsed = urlparse(uri)
+    parsed = _parse_uri(uri)
     if len(parsed.scheme) == 1:
         # Windows drive names are parsed as the scheme
         # e.g. "c:\path" -> ParseResult(scheme="c", netloc="", path="/path", ...)
@@ -84,17 +94,43 @@ def get_uri_location(uri: str) -> str:
         return parsed.netloc + parsed.path
 
 
+def _object_store_location(uri: str) -> str:
+    """
+    Same as `get_uri_location` for well-formed object store URIs
+    (e.g. "s3://bucket/key"), without the cost of a full `urlparse`.
+    """
+    _, sep, location = uri.partition("://")
+    if not sep:
+        return get_uri_location(uri)
+    return location.partition("?")[0].partition("#")[0]
+
+
+@functools.lru_cache(maxsize=8)
+def _s3_filesystem(
+    endpoint: Optional[str], region: Optional[str], profile: Optional[str]
+) -> pa_fs.S3FileSystem:
+    # constructing an S3FileSystem sets up a client and resolves credentials,
+    # so reuse it across calls
+    return pa_fs.S3FileSystem(
+        endpoint_override=endpoint,
+        request_timeout=30,
+        connect_timeout=30,
+    )
+
+
 def fs_from_uri(uri: str) -> Tuple[pa_fs.FileSystem, str]:
     """
     Get a PyArrow FileSystem from a URI, handling extra environment variables.
     """
     if get_uri_scheme(uri) == "s3":
-        fs = pa_fs.S3FileSystem(
-            endpoint_override=os.environ.get("AWS_ENDPOINT"),
-            request_timeout=30,
-            connect_timeout=30,
+        # the region and profile are part of the cache key so that changes to
+        # them are picked up; secrets are left out so they aren't kept around
+        fs = _s3_filesystem(
+            os.environ.get("AWS_ENDPOINT"),
+            os.environ.get("AWS_REGION", os.environ.get("AWS_DEFAULT_REGION")),
+            os.environ.get("AWS_PROFILE"),
         )
-        path = get_uri_location(uri)
+        path = _object_store_location(uri)
         return fs, path
 
     elif get_uri_scheme(uri) == "az" and adlfs is not None:
@@ -105,7 +141,7 @@ def fs_from_uri(uri: str) -> Tuple[pa_fs.FileSystem, str]:
 
         fs = pa_fs.PyFileSystem(pa_fs.FSSpecHandler(az_blob_fs))
 
-        path = get_uri_location(uri)
+        path = _object_store_location(uri)
         return fs, path
 
     return pa_fs.FileSystem.from_uri(uri)
@@ -126,7 +162,13 @@ def join_uri(base: Union[str, pathlib.Path], *parts: str) -> str:
     if isinstance(base, pathlib.Path):
         return base.joinpath(*parts)
     base = str(base)
-    if get_uri_scheme(base) == "file":
+    # absolute, relative (./, ../) and windows drive paths are local, so they
+    # don't need to be parsed as URLs
+    if not base or base[0] in "/." or (len(base) >= 2 and base[1] == ":"):
+        scheme = "file"
+    else:
+        scheme = get_uri_scheme(base)
+    if scheme == "file":
         # using pathlib for local paths make this windows compatible
         # `get_uri_scheme` returns `file` for windows drive names (e.g. `c:\path`)
         return str(pathlib.Path(base, *parts))
@@ -187,23 +229,43 @@ def flatten_columns(tbl: pa.Table, flatten: Optional[Union[int, bool]] = None):
         If unspecified, do not flatten the nested columns.
     """
     if flatten is True:
-        while True:
-            tbl = tbl.flatten()
-            # loop through all columns to check if there is any struct column
-            if any(pa.types.is_struct(col.type) for col in tbl.schema):
-                continue
-            else:
-                break
+        # no depth limit
+        depth = -1
     elif isinstance(flatten, int):
         if flatten <= 0:
             raise ValueError(
                 "Please specify a positive integer for flatten or the boolean "
                 "value `True`"
             )
-        while flatten > 0:
-            tbl = tbl.flatten()
-            flatten -= 1
-    return tbl
+        depth = flatten
+    else:
+        return tbl
+    # Walk each column down to the requested depth once, rather than calling
+    # pa.Table.flatten once per level of nesting
+    fields, columns = [], []
+    for field, column in zip(tbl.schema, tbl.columns):
+        _flatten_column(field, column, depth, fields, columns)
+    return pa.Table.from_arrays(
+        columns, schema=pa.schema(fields, metadata=tbl.schema.metadata)
+    )
+
+
+def _flatten_column(
+    field: pa.Field,
+    column: pa.ChunkedArray,
+    depth: int,
+    fields: List[pa.Field],
+    columns: List[pa.ChunkedArray],
+):
+    if depth == 0 or not pa.types.is_struct(field.type):
+        fields.append(field)
+        columns.append(column)
+        return
+    # same naming and nullability as pa.Table.flatten
+    for child_field, child in zip(field.type, column.flatten()):
+        child_field = child_field.with_name(f"{field.name}.{child_field.name}")
+        child_field = child_field.with_nullable(child_field.nullable or field.nullable)
+        _flatten_column(child_field, child, depth - 1, fields, columns)
 
 
 def inf_vector_column_query(schema: pa.Schema) -> str:
@@ -282,17 +344,17 @@ def infer_vector_column_name(
 
 
 @singledispatch
-def value_to_sql(value):
+def _value_to_sql(value):
     raise NotImplementedError("SQL conversion is not implemented for this type")
 
 
-@value_to_sql.register(str)
+@_value_to_sql.register(str)
 def _(value: str):
     value = value.replace("'", "''")
     return f"'{value}'"
 
 
-@value_to_sql.register(bytes)
+@_value_to_sql.register(bytes)
 def _(value: bytes):
     """Convert bytes to a hex string literal.
 
@@ -301,46 +363,215 @@ def _(value: bytes):
     return f"X'{binascii.hexlify(value).decode()}'"
 
 
-@value_to_sql.register(int)
+@_value_to_sql.register(int)
 def _(value: int):
     return str(value)
 
 
-@value_to_sql.register(float)
+@_value_to_sql.register(float)
 def _(value: float):
     return str(value)
 
 
-@value_to_sql.register(bool)
+@_value_to_sql.register(bool)
 def _(value: bool):
     return str(value).upper()
 
 
-@value_to_sql.register(type(None))
+@_value_to_sql.register(type(None))
 def _(value: type(None)):
     return "NULL"
 
 
-@value_to_sql.register(datetime)
+@_value_to_sql.register(datetime)
 def _(value: datetime):
     return f"'{value.isoformat()}'"
 
 
-@value_to_sql.register(date)
+@_value_to_sql.register(date)
 def _(value: date):
     return f"'{value.isoformat()}'"
 
 
-@value_to_sql.register(list)
+@_value_to_sql.register(list)
 def _(value: list):
+    if value:
+        # lists are usually homogeneous, so resolve the converter only once
+        first_type = type(value[0])
+        convert = _SQL_CONVERTERS.get(first_type)
+        if convert is not None and all(type(v) is first_type for v in value):
+            if first_type is datetime or first_type is date:
+                convert = _memoize_date_to_sql(convert)
+            return "[" + ", ".join(map(convert, value)) + "]"
     return "[" + ", ".join(map(value_to_sql, value)) + "]"
 
 
-@value_to_sql.register(np.ndarray)
+def _memoize_date_to_sql(convert):
+    # lists of timestamps (e.g. from logs) often repeat values, so only format
+    # each distinct one once. tzinfo is part of the key because the same instant
+    # in different time zones compares equal but formats differently.
+    cache = {}
+
+    def cached(value):
+        key = (value, getattr(value, "tzinfo", None))
+        sql = cache.get(key)
+        if sql is None:
+            sql = cache[key] = convert(value)
+        return sql
+
+    return cached
+
+
+@_value_to_sql.register(np.ndarray)
 def _(value: np.ndarray):
+    if value.ndim == 1 and value.dtype.kind in "iuf":
+        # numeric elements format the same as their python counterparts, so skip
+        # the per-element dispatch
+        return "[" + ", ".join(map(str, value.tolist())) + "]"
     return value_to_sql(value.tolist())
 
 
+# Exact-type lookup table for the registered converters, so the common types skip
+# the MRO walk that singledispatch does on every call.
+_SQL_CONVERTERS = {
+    cls: func for cls, func in _value_to_sql.registry.items() if cls is not object
+}
+# int and float literals are just their str(), calling it directly saves a python
+# frame per element when converting large numeric lists
+_SQL_CONVERTERS[int] = str
+_SQL_CONVERTERS[float] = str
+
+
+def value_to_sql(value) -> str:
+    """
+    Convert a python value into a SQL literal.
+
+    Parameters
+    ----------
+    value : Any
+        A str, bytes, int, float, bool, None, date, datetime, list or np.ndarray
+
+    Returns
+    -------
+    str: The SQL literal.
+    """
+    convert = _SQL_CONVERTERS.get(type(value))
+    if convert is None:
+        # subclasses of the supported types (or unsupported types)
+        return _value_to_sql(value)
+    return convert(value)
+
+
+_SQL_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<number>-?\d+(?:\.\d+)?)
+        |'(?P<string>(?:[^']|'')*)'
+        |(?P<name>[A-Za-z_][A-Za-z0-9_]*)
+        |(?P<op><=|>=|<>|!=|=|<|>)
+    )""",
+    re.VERBOSE,
+)
+
+# Lower case only, so the name means the same column whether or not the SQL
+# engine folds the case of unquoted identifiers
+_SQL_COLUMN = re.compile(r"[a-z_][a-z0-9_]*")
+
+_SQL_KEYWORDS = {
+    "AND",
+    "OR",
+    "NOT",
+    "IN",
+    "IS",
+    "NULL",
+    "LIKE",
+    "BETWEEN",
+    "TRUE",
+    "FALSE",
+}
+
+_SQL_COMPARISONS = {
+    "=": "equal",
+    "!=": "not_equal",
+    "<>": "not_equal",
+    "<": "less",
+    "<=": "less_equal",
+    ">": "greater",
+    ">=": "greater_equal",
+}
+
+
+def sql_filter_to_expression(where: str) -> "pc.Expression":
+    """
+    Translate a simple SQL filter into a pyarrow compute expression.
+
+    Only comparisons of a lower case column name with a number, string or
+    boolean literal (``column op literal``), joined by ``AND`` and ``OR``, are
+    supported.
+
+    Raises
+    ------
+    ValueError
+        For any other filter, which then has to be evaluated by lance or duckdb.
+    """
+    tokens = []
+    pos = 0
+    where = where.strip()
+    while pos < len(where):
+        match = _SQL_TOKEN.match(where, pos)
+        if match is None:
+            raise ValueError(f"Unsupported filter: {where}")
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == "name" and value.upper() in _SQL_KEYWORDS:
+            kind, value = "keyword", value.upper()
+        tokens.append((kind, value))
+        pos = match.end()
+
+    # AND binds tighter than OR
+    disjuncts = []
+    for conjunction in _split_sql_tokens(tokens, "OR"):
+        conjuncts = [
+            _sql_comparison(where, comparison)
+            for comparison in _split_sql_tokens(conjunction, "AND")
+        ]
+        disjuncts.append(functools.reduce(lambda a, b: a & b, conjuncts))
+    return functools.reduce(lambda a, b: a | b, disjuncts)
+
+
+def _split_sql_tokens(tokens: list, keyword: str) -> List[list]:
+    parts = [[]]
+    for token in tokens:
+        if token == ("keyword", keyword):
+            parts.append([])
+        else:
+            parts[-1].append(token)
+    return parts
+
+
+def _sql_comparison(where: str, tokens: list) -> "pc.Expression":
+    if len(tokens) != 3:
+        raise ValueError(f"Unsupported filter: {where}")
+    (column_kind, column), (op_kind, op), (literal_kind, literal) = tokens
+    if column_kind != "name" or not _SQL_COLUMN.fullmatch(column) or op_kind != "op":
+        raise ValueError(f"Unsupported filter: {where}")
+    if literal_kind == "number":
+        value = float(literal) if "." in literal else int(literal)
+    elif literal_kind == "string":
+        value = literal.replace("''", "'")
+    elif (literal_kind, literal) == ("keyword", "TRUE"):
+        value = True
+    elif (literal_kind, literal) == ("keyword", "FALSE"):
+        value = False
+    else:
+        raise ValueError(f"Unsupported filter: {where}")
+    try:
+        value = pc.scalar(value)
+    except (OverflowError, pa.ArrowException):
+        # e.g. integers that don't fit in 64 bits
+        raise ValueError(f"Unsupported filter: {where}")
+    return getattr(pc, _SQL_COMPARISONS[op])(pc.field(column), value)
+
+
 def deprecated(func):
     """This is a decorator which can be used to mark functions
     as deprecated. It will result in a warning being emitted
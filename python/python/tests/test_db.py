@@ -508,6 +508,48 @@ def test_delete_table(tmp_db: lancedb.DBConnection):
     tmp_db.drop_table("does_not_exist", ignore_missing=True)
 
 
+def test_len_and_contains(tmp_db: lancedb.DBConnection):
+    data = [{"vector": [3.1, 4.1], "item": "foo"}]
+    assert len(tmp_db) == 0
+    assert "test" not in tmp_db
+
+    # the cached listing must see tables created and dropped by this connection
+    for i in range(12):
+        tmp_db.create_table(f"test{i}", data=data)
+    assert len(tmp_db) == 12
+    assert "test11" in tmp_db
+    assert "test" not in tmp_db
+
+    tmp_db.drop_table("test11")
+    assert len(tmp_db) == 11
+    assert "test11" not in tmp_db
+
+    tmp_db.drop_database()
+    assert len(tmp_db) == 0
+
+
+def test_clear_connection_cache(tmp_path):
+    db = lancedb.connect(tmp_path)
+    db.create_table("test", data=[{"vector": [3.1, 4.1]}])
+    lancedb.clear_connection_cache()
+
+    # existing connections keep working, new ones connect afresh
+    assert db.table_names() == ["test"]
+    assert lancedb.connect(tmp_path).table_names() == ["test"]
+
+
+def test_len_and_contains_see_other_connections(tmp_path, monkeypatch):
+    monkeypatch.setattr(lancedb.db, "TABLE_NAMES_CACHE_TTL", timedelta(0))
+    db = lancedb.connect(tmp_path)
+    other = lancedb.connect(tmp_path)
+    assert "test" not in db
+
+    # without a read_consistency_interval the listing still expires
+    other.create_table("test", data=[{"vector": [3.1, 4.1]}])
+    assert "test" in db
+    assert len(db) == 1
+
+
 @pytest.mark.asyncio
 async def test_delete_table_async(tmp_db: lancedb.DBConnection):
     data = pd.DataFrame(
@@ -11,14 +11,15 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 import os
-import random
-from unittest import mock
+import sys
+from typing import Optional
+import uuid
 
 import lancedb as ldb
 from lancedb.db import DBConnection
 from lancedb.index import FTS
 import numpy as np
-import pandas as pd
+import pyarrow as pa
 import pytest
 from utils import exception_output
 
@@ -26,101 +27,106 @@ pytest.importorskip("lancedb.fts")
 tantivy = pytest.importorskip("tantivy")
 
 
-@pytest.fixture
-def table(tmp_path) -> ldb.table.LanceTable:
-    db = ldb.connect(tmp_path)
-    vectors = [np.random.randn(128) for _ in range(100)]
-
-    text_nouns = ("puppy", "car")
-    text2_nouns = ("rabbit", "girl", "monkey")
-    verbs = ("runs", "hits", "jumps", "drives", "barfs")
-    adv = ("crazily.", "dutifully.", "foolishly.", "merrily.", "occasionally.")
-    adj = ("adorable", "clueless", "dirty", "odd", "stupid")
-    text = [
-        " ".join(
-            [
-                text_nouns[random.randrange(0, len(text_nouns))],
-                verbs[random.randrange(0, 5)],
-                adv[random.randrange(0, 5)],
-                adj[random.randrange(0, 5)],
-            ]
-        )
-        for _ in range(100)
-    ]
-    text2 = [
-        " ".join(
-            [
-                text2_nouns[random.randrange(0, len(text2_nouns))],
-                verbs[random.randrange(0, 5)],
-                adv[random.randrange(0, 5)],
-                adj[random.randrange(0, 5)],
-            ]
-        )
-        for _ in range(100)
-    ]
-    count = [random.randint(1, 10000) for _ in range(100)]
-    table = db.create_table(
-        "test",
-        data=pd.DataFrame(
-            {
-                "vector": vectors,
-                "id": [i % 2 for i in range(100)],
-                "text": text,
-                "text2": text2,
-                "nested": [{"text": t} for t in text],
-                "count": count,
-            }
-        ),
+# Enough rows for every search term to have more matches than the tests'
+# limits with the fixed seed below (15 puppy rows, 7 rabbit rows and two
+# "puppy runs" phrases), without indexing more than the tests need
+SMALL_N = 30
+
+# Vectors for the test tables and for the rows tests add to them, drawn once.
+# The row after the table's vectors is the one _single_row adds.
+_VECTOR_POOL = np.random.default_rng(0).standard_normal(
+    (SMALL_N + 1, 128), dtype=np.float32
+)
+
+
+def _make_table_data(n: int) -> pa.Table:
+    rng = np.random.default_rng(1)
+    vectors = pa.FixedSizeListArray.from_arrays(_VECTOR_POOL[:n].reshape(-1), 128)
+
+    text_nouns = np.array(["puppy", "car"])
+    text2_nouns = np.array(["rabbit", "girl", "monkey"])
+    verbs = np.array(["runs", "hits", "jumps", "drives", "barfs"])
+    adv = np.array(
+        ["crazily.", "dutifully.", "foolishly.", "merrily.", "occasionally."]
+    )
+    adj = np.array(["adorable", "clueless", "dirty", "odd", "stupid"])
+
+    def sentences(nouns):
+        # one random word from each list per row, joined with spaces
+        words = [w[rng.integers(0, len(w), size=n)] for w in (nouns, verbs, adv, adj)]
+        text = words[0]
+        for column in words[1:]:
+            text = np.char.add(np.char.add(text, " "), column)
+        return text.tolist()
+
+    text = sentences(text_nouns)
+    text2 = sentences(text2_nouns)
+    count = rng.integers(1, 10001, size=n)
+    return pa.table(
+        {
+            "vector": vectors,
+            "id": np.arange(n) % 2,
+            "text": text,
+            "text2": text2,
+            "nested": pa.StructArray.from_arrays([pa.array(text)], names=["text"]),
+            "count": count,
+        }
     )
-    return table
+
+
+def _single_row(text: Optional[str], count: int) -> pa.Table:
+    # A row to add to the test tables, built directly in their schema. Tests
+    # that add several rows should add them in one table, each add commits
+    # a new version.
+    text = pa.array([text], pa.string())
+    return pa.table(
+        {
+            "vector": pa.FixedSizeListArray.from_arrays(_VECTOR_POOL[SMALL_N], 128),
+            "id": [101],
+            "text": text,
+            "text2": text,
+            "nested": pa.StructArray.from_arrays([text], names=["text"]),
+            "count": [count],
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def table_data() -> pa.Table:
+    # Generated once per module with a fixed seed. Each table fixture below
+    # still writes its own table, since most tests create indices on it.
+    return _make_table_data(SMALL_N)
+
+
+@pytest.fixture(scope="module")
+def db(tmp_path_factory) -> DBConnection:
+    # One connection for the module, each test gets its own uniquely named
+    # table in it
+    return ldb.connect(tmp_path_factory.mktemp("db"))
 
 
 @pytest.fixture
-async def async_table(tmp_path) -> ldb.table.AsyncTable:
+def table(db, table_data) -> ldb.table.LanceTable:
+    return db.create_table(f"test_{uuid.uuid4().hex}", data=table_data)
+
+
+@pytest.fixture
+async def async_table(tmp_path, table_data) -> ldb.table.AsyncTable:
     db = await ldb.connect_async(tmp_path)
-    vectors = [np.random.randn(128) for _ in range(100)]
-
-    text_nouns = ("puppy", "car")
-    text2_nouns = ("rabbit", "girl", "monkey")
-    verbs = ("runs", "hits", "jumps", "drives", "barfs")
-    adv = ("crazily.", "dutifully.", "foolishly.", "merrily.", "occasionally.")
-    adj = ("adorable", "clueless", "dirty", "odd", "stupid")
-    text = [
-        " ".join(
-            [
-                text_nouns[random.randrange(0, len(text_nouns))],
-                verbs[random.randrange(0, 5)],
-                adv[random.randrange(0, 5)],
-                adj[random.randrange(0, 5)],
-            ]
-        )
-        for _ in range(100)
-    ]
-    text2 = [
-        " ".join(
-            [
-                text2_nouns[random.randrange(0, len(text2_nouns))],
-                verbs[random.randrange(0, 5)],
-                adv[random.randrange(0, 5)],
-                adj[random.randrange(0, 5)],
-            ]
-        )
-        for _ in range(100)
-    ]
-    count = [random.randint(1, 10000) for _ in range(100)]
-    table = await db.create_table(
-        "test",
-        data=pd.DataFrame(
-            {
-                "vector": vectors,
-                "id": [i % 2 for i in range(100)],
-                "text": text,
-                "text2": text2,
-                "nested": [{"text": t} for t in text],
-                "count": count,
-            }
-        ),
-    )
+    return await db.create_table("test", data=table_data)
+
+
+@pytest.fixture(params=[True, False], ids=["tantivy", "native"])
+def use_tantivy(request) -> bool:
+    return request.param
+
+
+@pytest.fixture(scope="module", params=[True, False], ids=["tantivy", "native"])
+def indexed_table(request, db, table_data) -> ldb.table.LanceTable:
+    # An FTS index on "text" shared by the tests that only search it, so the
+    # index is built once per module for each implementation
+    table = db.create_table(f"indexed_{uuid.uuid4().hex}", data=table_data)
+    table.create_fts_index("text", use_tantivy=request.param)
     return table
 
 
@@ -141,7 +147,6 @@ def test_create_index_with_stemming(tmp_path, table):
     table.create_fts_index("text", tokenizer_name="en_stem", use_tantivy=True)
 
 
-@pytest.mark.parametrize("use_tantivy", [True, False])
 @pytest.mark.parametrize("with_position", [True, False])
 def test_create_inverted_index(table, use_tantivy, with_position):
     if use_tantivy and not with_position:
@@ -164,10 +169,22 @@ def test_search_index(tmp_path, table):
     assert len(results[1]) == 5  # _score
 
 
-@pytest.mark.parametrize("use_tantivy", [True, False])
-def test_search_fts(table, use_tantivy):
-    table.create_fts_index("text", use_tantivy=use_tantivy)
-    results = table.search("puppy").select(["id", "text"]).limit(5).to_list()
+def test_open_index_reuses_handle(tmp_path, table):
+    index_path = str(tmp_path / "index")
+    index = ldb.fts.create_index(index_path, ["text"])
+    ldb.fts.populate_index(index, table, ["text"])
+    opened = ldb.fts.open_index(index_path)
+    assert ldb.fts.open_index(index_path) is opened
+
+    # a new commit invalidates the cached handle
+    ldb.fts.populate_index(index, table, ["text"])
+    reopened = ldb.fts.open_index(index_path)
+    assert reopened is not opened
+    assert reopened.searcher().num_docs == 2 * len(table)
+
+
+def test_search_fts(indexed_table):
+    results = indexed_table.search("puppy").select(["id", "text"]).limit(5).to_list()
     assert len(results) == 5
     assert len(results[0]) == 3  # id, text, _score
 
@@ -352,40 +369,28 @@ def test_search_ordering_field_index(tmp_path, table):
     assert sorted(rows, key=lambda x: x["count"], reverse=True) == rows
 
 
-@pytest.mark.parametrize("use_tantivy", [True, False])
 def test_create_index_from_table(tmp_path, table, use_tantivy):
     table.create_fts_index("text", use_tantivy=use_tantivy)
-    df = table.search("puppy").limit(5).select(["text"]).to_pandas()
-    assert len(df) <= 5
-    assert "text" in df.columns
+    results = table.search("puppy").limit(5).select(["text"]).to_arrow()
+    assert results.num_rows <= 5
+    assert "text" in results.column_names
 
     # Check whether it can be updated
-    table.add(
-        [
-            {
-                "vector": np.random.randn(128),
-                "id": 101,
-                "text": "gorilla",
-                "text2": "gorilla",
-                "nested": {"text": "gorilla"},
-                "count": 10,
-            }
-        ]
-    )
+    table.add(_single_row("gorilla", count=10))
 
     with pytest.raises(Exception, match="already exists"):
         table.create_fts_index("text", use_tantivy=use_tantivy)
 
     table.create_fts_index("text", replace=True, use_tantivy=use_tantivy)
-    assert len(table.search("gorilla").limit(1).to_pandas()) == 1
+    assert table.search("gorilla").limit(1).to_arrow().num_rows == 1
 
 
 def test_create_index_multiple_columns(tmp_path, table):
     table.create_fts_index(["text", "text2"], use_tantivy=True)
-    df = table.search("puppy").limit(5).to_pandas()
-    assert len(df) == 5
-    assert "text" in df.columns
-    assert "text2" in df.columns
+    results = table.search("puppy").limit(5).to_arrow()
+    assert results.num_rows == 5
+    assert "text" in results.column_names
+    assert "text2" in results.column_names
 
 
 def test_empty_rs(tmp_path, table, mocker):
@@ -401,18 +406,12 @@ def test_nested_schema(tmp_path, table):
     assert len(rs) == 5
 
 
-@pytest.mark.parametrize("use_tantivy", [True, False])
-def test_search_index_with_filter(table, use_tantivy):
-    table.create_fts_index("text", use_tantivy=use_tantivy)
-    orig_import = __import__
-
-    def import_mock(name, *args):
-        if name == "duckdb":
-            raise ImportError
-        return orig_import(name, *args)
+def test_search_index_with_filter(indexed_table, monkeypatch):
+    table = indexed_table
 
-    # no duckdb
-    with mock.patch("builtins.__import__", side_effect=import_mock):
+    # no duckdb, a None entry in sys.modules makes `import duckdb` fail
+    with monkeypatch.context() as m:
+        m.setitem(sys.modules, "duckdb", None)
         rs = table.search("puppy").where("id=1").limit(10)
         # test schema
         assert rs.to_arrow().drop("_score").schema.equals(table.schema)
@@ -433,49 +432,38 @@ def test_search_index_with_filter(table, use_tantivy):
         assert r["_rowid"] is not None
 
 
-@pytest.mark.parametrize("use_tantivy", [True, False])
 def test_null_input(table, use_tantivy):
-    table.add(
-        [
-            {
-                "vector": np.random.randn(128),
-                "id": 101,
-                "text": None,
-                "text2": None,
-                "nested": {"text": None},
-                "count": 7,
-            }
-        ]
-    )
+    table.add(_single_row(None, count=7))
     table.create_fts_index("text", use_tantivy=use_tantivy)
 
 
-def test_syntax(table):
-    # https://github.com/lancedb/lancedb/issues/769
-    table.create_fts_index("text", use_tantivy=True)
+# https://github.com/lancedb/lancedb/issues/769
+@pytest.mark.parametrize("indexed_table", [True], ids=["tantivy"], indirect=True)
+def test_syntax_error(indexed_table):
     with pytest.raises(ValueError, match="Syntax Error"):
-        table.search("they could have been dogs OR").limit(10).to_list()
-
+        indexed_table.search("they could have been dogs OR").limit(10).to_list()
+
+
+@pytest.mark.parametrize("indexed_table", [True], ids=["tantivy"], indirect=True)
+@pytest.mark.parametrize(
+    "query, phrase_query",
+    [
+        # terms queries
+        ('"they could have been dogs" OR cats', False),
+        ("(they AND could) OR (have AND been AND dogs) OR cats", False),
+        # phrase queries
+        ("they could have been dogs OR cats", True),
+        ('"they could have been dogs OR cats"', False),
+        ('''"the cats OR dogs were not really 'pets' at all"''', False),
+        ('the cats OR dogs were not really "pets" at all', True),
+    ],
+)
+def test_syntax(indexed_table, query, phrase_query):
     # these should work
-
-    # terms queries
-    table.search('"they could have been dogs" OR cats').limit(10).to_list()
-    table.search("(they AND could) OR (have AND been AND dogs) OR cats").limit(
-        10
-    ).to_list()
-
-    # phrase queries
-    table.search("they could have been dogs OR cats").phrase_query().limit(10).to_list()
-    table.search('"they could have been dogs OR cats"').limit(10).to_list()
-    table.search('''"the cats OR dogs were not really 'pets' at all"''').limit(
-        10
-    ).to_list()
-    table.search('the cats OR dogs were not really "pets" at all').phrase_query().limit(
-        10
-    ).to_list()
-    table.search('the cats OR dogs were not really "pets" at all').phrase_query().limit(
-        10
-    ).to_list()
+    builder = indexed_table.search(query)
+    if phrase_query:
+        builder = builder.phrase_query()
+    builder.limit(10).to_list()
 
 
 def test_language(mem_db: DBConnection):
@@ -1,22 +1,30 @@
 # SPDX-License-Identifier: Apache-2.0
 # SPDX-FileCopyrightText: Copyright The LanceDB Authors
 
+import asyncio
 import unittest.mock as mock
 from datetime import timedelta
 from pathlib import Path
 
 import lancedb
+from lancedb.arrow import _to_prefetching_reader
+from lancedb.background_loop import LOOP
 from lancedb.index import IvfPq, FTS
 import numpy as np
 import pandas.testing as tm
 import pyarrow as pa
 import pytest
 import pytest_asyncio
+from lancedb.conftest import (
+    MockNonNormTextEmbeddingFunction,
+    MockTextEmbeddingFunction,
+)
 from lancedb.pydantic import LanceModel, Vector
 from lancedb.query import (
     AsyncQueryBase,
     LanceVectorQueryBuilder,
     Query,
+    _compute_query_embedding,
 )
 from lancedb.table import AsyncTable, LanceTable
 
@@ -299,6 +307,15 @@ def test_vector_query_with_no_limit(table):
         ).to_list()
 
 
+def test_query_builder_batches_many(table):
+    builders = [
+        LanceVectorQueryBuilder(table, [0, 0], "vector").limit(1).select(["id"]),
+        LanceVectorQueryBuilder(table, [3, 4], "vector").limit(1).select(["id"]),
+    ]
+    results = LanceVectorQueryBuilder.to_batches_many(builders)
+    assert [rs.read_all()["id"].to_pylist() for rs in results] == [[1], [2]]
+
+
 def test_query_builder_batches(table):
     rs = (
         LanceVectorQueryBuilder(table, [0, 0], "vector")
@@ -318,6 +335,25 @@ def test_query_builder_batches(table):
     assert rs_list[0].to_pandas()["id"][1] == 2
 
 
+def test_prefetching_reader(table):
+    stream = LOOP.run(table._table.query().to_batches(max_batch_length=1))
+    reader = _to_prefetching_reader(stream, LOOP.loop)
+    batches = list(reader)
+    assert [len(batch) for batch in batches] == [1, 1]
+    assert pa.Table.from_batches(batches)["id"].to_pylist() == [1, 2]
+
+
+def test_prefetching_reader_on_its_own_loop(table):
+    # e.g. read from a coroutine on the background loop, which must not block
+    # waiting on itself
+    async def read():
+        stream = await table._table.query().to_batches(max_batch_length=1)
+        return list(_to_prefetching_reader(stream, asyncio.get_running_loop()))
+
+    batches = LOOP.run(read())
+    assert pa.Table.from_batches(batches)["id"].to_pylist() == [1, 2]
+
+
 def test_dynamic_projection(table):
     rs = (
         LanceVectorQueryBuilder(table, [0, 0], "vector")
@@ -418,6 +454,29 @@ def test_query_builder_with_different_vector_column():
     )
 
 
+def test_query_embedding_cache():
+    func = MockTextEmbeddingFunction()
+    with mock.patch.object(
+        type(func),
+        "compute_query_embeddings",
+        side_effect=lambda query: [np.array([1.0, 2.0])],
+    ) as compute:
+        first = _compute_query_embedding(func, "cached query")
+        first[0] = 100.0
+        second = _compute_query_embedding(func, "cached query")
+    assert compute.call_count == 1
+    np.testing.assert_array_equal(second, [1.0, 2.0])
+
+
+def test_query_embedding_cache_keyed_on_class():
+    # same (empty) configuration, different embedding functions
+    query = "a long enough query"
+    normalized = _compute_query_embedding(MockTextEmbeddingFunction(), query)
+    nonnorm = _compute_query_embedding(MockNonNormTextEmbeddingFunction(), query)
+    np.testing.assert_array_equal(nonnorm, [float(ord(c)) for c in query[:10]])
+    assert not np.array_equal(normalized, nonnorm)
+
+
 def cosine_distance(vec1, vec2):
     return 1 - np.dot(vec1, vec2) / (np.linalg.norm(vec1) * np.linalg.norm(vec2))
 
@@ -229,6 +229,123 @@ def test_table_add_in_threadpool():
                 future.result()
 
 
+def test_table_schema_is_cached():
+    describe_calls = 0
+
+    def handler(request):
+        nonlocal describe_calls
+        if request.path == "/v1/table/test/describe/":
+            describe_calls += 1
+            request.send_response(200)
+            request.send_header("Content-Type", "application/json")
+            request.end_headers()
+            payload = json.dumps(
+                dict(
+                    version=1,
+                    schema=dict(
+                        fields=[
+                            dict(name="id", type={"type": "int64"}, nullable=False),
+                        ]
+                    ),
+                )
+            )
+            request.wfile.write(payload.encode())
+        else:
+            request.send_response(404)
+            request.end_headers()
+
+    with mock_lancedb_connection(handler) as db:
+        table = db.open_table("test")
+        calls_before = describe_calls
+        assert table.schema == pa.schema([pa.field("id", pa.int64(), False)])
+        assert table.schema.names == ["id"]
+        assert describe_calls == calls_before + 1
+
+
+def test_table_len_is_cached():
+    count_calls = 0
+
+    def handler(request):
+        nonlocal count_calls
+        if request.path == "/v1/table/test/count_rows/":
+            count_calls += 1
+            request.send_response(200)
+            request.send_header("Content-Type", "application/json")
+            request.end_headers()
+            request.wfile.write(b"42")
+        elif request.path == "/v1/table/test/delete/":
+            request.send_response(200)
+            request.end_headers()
+        elif request.path == "/v1/table/test/describe/":
+            request.send_response(200)
+            request.send_header("Content-Type", "application/json")
+            request.end_headers()
+            payload = json.dumps(
+                dict(
+                    version=1,
+                    schema=dict(
+                        fields=[
+                            dict(name="id", type={"type": "int64"}, nullable=False),
+                        ]
+                    ),
+                )
+            )
+            request.wfile.write(payload.encode())
+        else:
+            request.send_response(404)
+            request.end_headers()
+
+    with mock_lancedb_connection(handler) as db:
+        table = db.open_table("test")
+        assert len(table) == 42
+        assert len(table) == 42
+        assert count_calls == 1
+
+        # writes through the table invalidate the cached count
+        table.delete("id = 1")
+        assert len(table) == 42
+        assert count_calls == 2
+
+
+def test_table_bulk():
+    delete_predicates = []
+
+    def handler(request):
+        if request.path == "/v1/table/test/delete/":
+            content_len = int(request.headers.get("Content-Length"))
+            body = json.loads(request.rfile.read(content_len))
+            delete_predicates.append(body["predicate"])
+            request.send_response(200)
+            request.end_headers()
+        elif request.path == "/v1/table/test/describe/":
+            request.send_response(200)
+            request.send_header("Content-Type", "application/json")
+            request.end_headers()
+            payload = json.dumps(
+                dict(
+                    version=1,
+                    schema=dict(
+                        fields=[
+                            dict(name="id", type={"type": "int64"}, nullable=False),
+                        ]
+                    ),
+                )
+            )
+            request.wfile.write(payload.encode())
+        else:
+            request.send_response(404)
+            request.end_headers()
+
+    with mock_lancedb_connection(handler) as db:
+        table = db.open_table("test")
+        results = table.bulk([("delete", (f"id = {i}",), {}) for i in range(5)])
+        assert results == [None] * 5
+        assert sorted(delete_predicates) == [f"id = {i}" for i in range(5)]
+
+        with pytest.raises(ValueError, match="Unsupported bulk operation"):
+            table.bulk([("drop_columns", (["id"],), {})])
+
+
 def test_table_create_indices():
     def handler(request):
         if request.path == "/v1/table/test/create_index/":
@@ -3,6 +3,7 @@ import random
 
 import lancedb
 import numpy as np
+import pyarrow as pa
 import pytest
 from lancedb.conftest import MockTextEmbeddingFunction  # noqa
 from lancedb.embeddings import EmbeddingFunctionRegistry
@@ -284,6 +285,32 @@ def test_linear_combination(tmp_path, use_tantivy):
     _run_test_hybrid_reranker(reranker, tmp_path, use_tantivy)
 
 
+def test_linear_combination_merge_results():
+    reranker = LinearCombinationReranker(weight=0.7, fill=1.0, return_score="all")
+    vector_results = pa.table(
+        {
+            "_distance": pa.array([0.2, 0.4], pa.float32()),
+            "_rowid": pa.array([1, 2], pa.uint64()),
+        }
+    )
+    # row 2 is in both result sets, rows 3 and 4 sort after all vector results
+    fts_results = pa.table(
+        {
+            "_score": pa.array([0.5, 0.9, 0.1], pa.float32()),
+            "_rowid": pa.array([2, 3, 4], pa.uint64()),
+        }
+    )
+    result = reranker.merge_results(vector_results, fts_results, reranker.fill)
+    assert result["_rowid"].to_pylist() == [3, 2, 1, 4]
+    assert result["_score"].to_pylist()[1] == 0.5
+    assert result["_distance"].null_count == 2
+    np.testing.assert_allclose(
+        result["_relevance_score"].to_numpy(),
+        [0.63, 0.57, 0.56, 0.07],
+        rtol=1e-6,
+    )
+
+
 @pytest.mark.parametrize("use_tantivy", [True, False])
 def test_rrf_reranker(tmp_path, use_tantivy):
     reranker = RRFReranker()
@@ -19,6 +19,7 @@ from lancedb.conftest import MockTextEmbeddingFunction
 from lancedb.db import AsyncConnection, DBConnection
 from lancedb.embeddings import EmbeddingFunctionConfig, EmbeddingFunctionRegistry
 from lancedb.pydantic import LanceModel, Vector
+from lancedb.rerankers import LinearCombinationReranker, RRFReranker
 from lancedb.table import LanceTable
 from pydantic import BaseModel
 
@@ -150,6 +151,19 @@ def test_create_table(mem_db: DBConnection):
         assert expected == tbl
 
 
+def test_create_table_numpy_rows(mem_db: DBConnection):
+    rows = [
+        {"vector": np.array([3.1, 4.1], dtype=np.float32), "item": "foo"},
+        {"vector": np.array([5.9, 26.5], dtype=np.float32), "item": "bar"},
+    ]
+    tbl = mem_db.create_table("test", data=rows)
+    assert tbl.schema.field("vector").type == pa.list_(pa.float32(), 2)
+    assert tbl.to_arrow()["vector"].to_pylist() == [
+        [pytest.approx(3.1), pytest.approx(4.1)],
+        [pytest.approx(5.9), pytest.approx(26.5)],
+    ]
+
+
 def test_empty_table(mem_db: DBConnection):
     schema = pa.schema(
         [
@@ -230,6 +244,29 @@ def test_add(mem_db: DBConnection):
     _add(table, schema)
 
 
+def test_add_in_slices(mem_db: DBConnection, monkeypatch):
+    # force the data to be sanitized and written a few rows at a time
+    monkeypatch.setattr(lancedb.table, "_SANITIZE_CHUNK_BYTES", 64)
+    table = mem_db.create_table(
+        "test",
+        schema=pa.schema(
+            [
+                pa.field("id", pa.int64()),
+                pa.field("vector", pa.list_(pa.float32(), 2)),
+            ]
+        ),
+    )
+    data = pa.table(
+        {
+            "id": pa.array(range(100), pa.int32()),
+            "vector": [[float(i), float(i)] for i in range(100)],
+        }
+    )
+    table.add(data)
+    assert len(table) == 100
+    assert sorted(table.to_arrow()["id"].to_pylist()) == list(range(100))
+
+
 def test_add_subschema(mem_db: DBConnection):
     schema = pa.schema(
         [
@@ -1246,6 +1283,43 @@ def test_hybrid_search_metric_type(tmp_db: DBConnection):
     assert result_dot["_relevance_score"] != result_l2["_relevance_score"]
 
 
+def test_hybrid_search_distance_range(tmp_db: DBConnection):
+    # This test uses an FTS index
+    pytest.importorskip("lancedb.fts")
+
+    table, _, _ = setup_hybrid_search_table(tmp_db, "test")
+    result = (
+        table.search("Our father who art in heaven", query_type="hybrid")
+        .distance_range(upper_bound=0.0)
+        .with_row_id(True)
+        .to_arrow()
+    )
+    fts_results = (
+        table.search("Our father who art in heaven", query_type="fts")
+        .with_row_id(True)
+        .to_arrow()
+    )
+    # no vector result is within the range, so only fts results are left
+    assert set(result["_rowid"].to_pylist()) <= set(fts_results["_rowid"].to_pylist())
+
+
+def test_hybrid_search_empty_results(tmp_db: DBConnection):
+    # This test uses an FTS index
+    pytest.importorskip("lancedb.fts")
+
+    table, _, _ = setup_hybrid_search_table(tmp_db, "test")
+    for reranker in [RRFReranker(), LinearCombinationReranker()]:
+        result = (
+            table.search("Our father who art in heaven", query_type="hybrid")
+            .where("text = 'no such text'", prefilter=True)
+            .rerank(reranker)
+            .to_arrow()
+        )
+        assert len(result) == 0
+        assert "_relevance_score" in result.column_names
+        assert "_rowid" not in result.column_names
+
+
 @pytest.mark.parametrize(
     "consistency_interval", [None, timedelta(seconds=0), timedelta(seconds=0.1)]
 )
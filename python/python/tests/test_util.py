@@ -16,6 +16,7 @@ import pathlib
 from typing import Optional
 
 import lance
+import numpy as np
 from lancedb.conftest import MockTextEmbeddingFunction
 from lancedb.embeddings.base import EmbeddingFunctionConfig
 from lancedb.embeddings.registry import EmbeddingFunctionRegistry
@@ -32,7 +33,12 @@ import pandas as pd
 import polars as pl
 import pytest
 import lancedb
-from lancedb.util import get_uri_scheme, join_uri, value_to_sql
+from lancedb.util import (
+    get_uri_scheme,
+    join_uri,
+    sql_filter_to_expression,
+    value_to_sql,
+)
 from utils import exception_output
 
 
@@ -130,6 +136,57 @@ def test_value_to_sql_string(tmp_path):
         assert table.to_pandas().query("search == @value")["replace"].item() == value
 
 
+def test_value_to_sql_list():
+    assert value_to_sql([1, 2, 3]) == "[1, 2, 3]"
+    assert value_to_sql([1, "a", None, True]) == "[1, 'a', NULL, TRUE]"
+    assert value_to_sql([[1, 2], [3]]) == "[[1, 2], [3]]"
+    assert value_to_sql([]) == "[]"
+
+    # numpy arrays format the same as the equivalent python lists
+    for arr in [
+        np.array([1, 2, 3]),
+        np.array([0.5, 2.0], dtype=np.float32),
+        np.array([True, False]),
+        np.array([[1, 2], [3, 4]]),
+        np.array(["a", "b"]),
+    ]:
+        assert value_to_sql(arr) == value_to_sql(arr.tolist())
+
+
+def test_sql_filter_to_expression():
+    tbl = pa.table(
+        {
+            "id": [1, 2, 3, None],
+            "name": ["a", "b'c", "c", None],
+            "score": [1.5, 2.5, 3.5, 4.5],
+        }
+    )
+
+    def ids(where):
+        return tbl.filter(sql_filter_to_expression(where))["score"].to_pylist()
+
+    assert ids("id = 1") == [1.5]
+    assert ids("id > 1 AND name != 'c'") == [2.5]
+    assert ids("name = 'b''c' OR score >= 4") == [2.5, 4.5]
+    # AND binds tighter than OR
+    assert ids("id = 1 OR id = 2 AND name = 'c'") == [1.5]
+
+    for where in [
+        "name LIKE 'a%'",
+        "id + 1 = 2",
+        "id BETWEEN 1 AND 2",
+        "id IN (1, 3)",
+        "name IS NULL",
+        "NOT id = 1",
+        "(id = 1)",
+        "ID = 1",
+        "`id` = 1",
+        "id =",
+    ]:
+        with pytest.raises(ValueError):
+            sql_filter_to_expression(where)
+
+
 def test_append_vector_columns():
     registry = EmbeddingFunctionRegistry.get_instance()
     registry.register("test")(MockTextEmbeddingFunction)
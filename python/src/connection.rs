@@ -1,7 +1,12 @@
 // SPDX-License-Identifier: Apache-2.0
 // SPDX-FileCopyrightText: Copyright The LanceDB Authors
 
-use std::{collections::HashMap, str::FromStr, sync::Arc, time::Duration};
+use std::{
+    collections::HashMap,
+    str::FromStr,
+    sync::{Arc, Mutex, OnceLock},
+    time::Duration,
+};
 
 use arrow::{datatypes::Schema, ffi_stream::ArrowArrayStreamReader, pyarrow::FromPyArrow};
 use lancedb::connection::{Connection as LanceConnection, CreateTableMode, LanceFileVersion};
@@ -198,13 +203,61 @@ impl Connection {
 
     pub fn drop_db(self_: PyRef<'_, Self>) -> PyResult<Bound<'_, PyAny>> {
         let inner = self_.get_inner()?.clone();
-        future_into_py(
-            self_.py(),
-            async move { inner.drop_db().await.infer_error() },
-        )
+        future_into_py(self_.py(), async move {
+            inner.drop_db().await.infer_error()?;
+            // The next connect should set the database up again
+            forget_connection(inner.uri());
+            Ok(())
+        })
     }
 }
 
+/// (uri, read_consistency_interval in seconds as bits, sorted storage options)
+type ConnectionKey = (String, Option<u64>, Vec<(String, String)>);
+
+const MAX_CACHED_CONNECTIONS: usize = 32;
+
+/// Recently opened native (non-remote) connections, most recent first.
+///
+/// Each Python `Connection` gets its own clone, so closing one does not close
+/// the others, but they share the object store and other per-database state.
+/// Entries are only removed by `drop_db`, by eviction, or by
+/// `clear_connection_cache`.
+static CONNECTION_CACHE: OnceLock<Mutex<Vec<(ConnectionKey, LanceConnection)>>> = OnceLock::new();
+
+fn connection_cache() -> &'static Mutex<Vec<(ConnectionKey, LanceConnection)>> {
+    CONNECTION_CACHE.get_or_init(|| Mutex::new(Vec::new()))
+}
+
+fn cached_connection(key: &ConnectionKey) -> Option<LanceConnection> {
+    let mut cache = connection_cache().lock().unwrap();
+    let pos = cache.iter().position(|(k, _)| k == key)?;
+    let entry = cache.remove(pos);
+    let conn = entry.1.clone();
+    cache.insert(0, entry);
+    Some(conn)
+}
+
+fn cache_connection(key: ConnectionKey, conn: LanceConnection) {
+    let mut cache = connection_cache().lock().unwrap();
+    cache.retain(|(k, _)| k != &key);
+    cache.insert(0, (key, conn));
+    cache.truncate(MAX_CACHED_CONNECTIONS);
+}
+
+fn forget_connection(uri: &str) {
+    let mut cache = connection_cache().lock().unwrap();
+    cache.retain(|(_, conn)| conn.uri() != uri);
+}
+
+/// Drop every cached native connection, so the next connect opens a new one.
+///
+/// Connections that were already handed out keep working.
+#[pyfunction]
+pub fn clear_connection_cache() {
+    connection_cache().lock().unwrap().clear();
+}
+
 #[pyfunction]
 #[pyo3(signature = (uri, api_key=None, region=None, host_override=None, read_consistency_interval=None, client_config=None, storage_options=None))]
 #[allow(clippy::too_many_arguments)]
@@ -219,6 +272,27 @@ pub fn connect(
     storage_options: Option<HashMap<String, String>>,
 ) -> PyResult<Bound<'_, PyAny>> {
     future_into_py(py, async move {
+        // Remote connections carry credentials and client settings, so only
+        // native ones are shared.
+        let cache_key = if api_key.is_none() && client_config.is_none() {
+            let mut options = storage_options
+                .clone()
+                .unwrap_or_default()
+                .into_iter()
+                .collect::<Vec<_>>();
+            options.sort();
+            Some((
+                uri.clone(),
+                read_consistency_interval.map(f64::to_bits),
+                options,
+            ))
+        } else {
+            None
+        };
+        if let Some(conn) = cache_key.as_ref().and_then(cached_connection) {
+            return Ok(Connection::new(conn));
+        }
+
         let mut builder = lancedb::connect(&uri);
         if let Some(api_key) = api_key {
             builder = builder.api_key(&api_key);
@@ -240,7 +314,11 @@ pub fn connect(
         if let Some(client_config) = client_config {
             builder = builder.client_config(client_config.into());
         }
-        Ok(Connection::new(builder.execute().await.infer_error()?))
+        let conn = builder.execute().await.infer_error()?;
+        if let Some(cache_key) = cache_key {
+            cache_connection(cache_key, conn.clone());
+        }
+        Ok(Connection::new(conn))
     })
 }
 
@@ -13,7 +13,7 @@
 // limitations under the License.
 
 use arrow::RecordBatchStream;
-use connection::{connect, Connection};
+use connection::{clear_connection_cache, connect, Connection};
 use env_logger::Env;
 use index::IndexConfig;
 use pyo3::{
@@ -45,6 +45,7 @@ pub fn _lancedb(_py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<VectorQuery>()?;
     m.add_class::<RecordBatchStream>()?;
     m.add_function(wrap_pyfunction!(connect, m)?)?;
+    m.add_function(wrap_pyfunction!(clear_connection_cache, m)?)?;
     m.add_function(wrap_pyfunction!(util::validate_table_name, m)?)?;
     m.add("__version__", env!("CARGO_PKG_VERSION"))?;
     Ok(())
@@ -421,6 +421,40 @@ impl HybridQuery {
         })
     }
 
+    /// Execute the full text and vector legs concurrently in a single call.
+    ///
+    /// Both legs always include row ids, since those are needed for reranking.
+    /// Returns the (fts, vector) result streams; combining them is left to the
+    /// caller's reranker.
+    #[pyo3(signature = (max_batch_length=None))]
+    pub fn execute_legs(
+        self_: PyRef<'_, Self>,
+        max_batch_length: Option<u32>,
+    ) -> PyResult<Bound<'_, PyAny>> {
+        let fts_query = self_
+            .inner_fts
+            .inner
+            .clone()
+            .full_text_search(self_.inner_fts.fts_query.clone())
+            .with_row_id();
+        let vector_query = self_.inner_vec.inner.clone().with_row_id();
+        future_into_py(self_.py(), async move {
+            let mut opts = QueryExecutionOptions::default();
+            if let Some(max_batch_length) = max_batch_length {
+                opts.max_batch_length = max_batch_length;
+            }
+            let (fts_stream, vector_stream) = futures::try_join!(
+                fts_query.execute_with_options(opts.clone()),
+                vector_query.execute_with_options(opts)
+            )
+            .infer_error()?;
+            Ok((
+                RecordBatchStream::new(fts_stream),
+                RecordBatchStream::new(vector_stream),
+            ))
+        })
+    }
+
     pub fn get_limit(&mut self) -> Option<u32> {
         self.inner_fts.inner.limit.map(|i| i as u32)
     }
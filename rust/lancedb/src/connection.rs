@@ -17,7 +17,7 @@
 use std::collections::HashMap;
 use std::fs::create_dir_all;
 use std::path::Path;
-use std::sync::Arc;
+use std::sync::{Arc, OnceLock};
 
 use arrow_array::{RecordBatchIterator, RecordBatchReader};
 use arrow_schema::SchemaRef;
@@ -40,7 +40,7 @@ use crate::Table;
 pub use lance_encoding::version::LanceFileVersion;
 #[cfg(feature = "remote")]
 use lance_io::object_store::StorageOptions;
-use lance_table::io::commit::commit_handler_from_url;
+use lance_table::io::commit::{commit_handler_from_url, CommitHandler};
 
 pub const LANCE_FILE_EXTENSION: &str = "lance";
 
@@ -783,6 +783,9 @@ struct Database {
     // Storage options to be inherited by tables created from this connection
     storage_options: HashMap<String, String>,
     embedding_registry: Arc<dyn EmbeddingRegistry>,
+
+    // Commit handler used when dropping tables, resolved on first use
+    commit_handler: OnceLock<Arc<dyn CommitHandler>>,
 }
 
 impl std::fmt::Display for Database {
@@ -809,6 +812,26 @@ const MIRRORED_STORE: &str = "mirroredStore";
 
 /// A connection to LanceDB
 impl Database {
+    /// The commit handler for this database, created once and reused so that
+    /// dropping many tables doesn't rebuild it (and its clients) every time.
+    async fn commit_handler(&self) -> Arc<dyn CommitHandler> {
+        if let Some(handler) = self.commit_handler.get() {
+            return handler.clone();
+        }
+        let object_store_params = ObjectStoreParams {
+            storage_options: Some(self.storage_options.clone()),
+            ..Default::default()
+        };
+        let mut uri = self.uri.clone();
+        if let Some(query_string) = &self.query_string {
+            uri.push_str(&format!("?{}", query_string));
+        }
+        let handler = commit_handler_from_url(&uri, &Some(object_store_params))
+            .await
+            .unwrap();
+        self.commit_handler.get_or_init(|| handler).clone()
+    }
+
     async fn connect_with_options(options: &ConnectBuilder) -> Result<Self> {
         let uri = &options.uri;
         let parse_res = url::Url::parse(uri);
@@ -905,6 +928,7 @@ impl Database {
                     read_consistency_interval: options.read_consistency_interval,
                     storage_options,
                     embedding_registry,
+                    commit_handler: OnceLock::new(),
                 })
             }
             Err(_) => {
@@ -940,6 +964,7 @@ impl Database {
             read_consistency_interval,
             storage_options: HashMap::new(),
             embedding_registry,
+            commit_handler: OnceLock::new(),
         })
     }
 
@@ -989,22 +1014,18 @@ impl ConnectionInternal for Database {
             .read_dir(self.base_path.clone())
             .await?
             .iter()
-            .map(Path::new)
-            .filter(|path| {
-                let is_lance = path
-                    .extension()
-                    .and_then(|e| e.to_str())
-                    .map(|e| e == LANCE_EXTENSION);
-                is_lance.unwrap_or(false)
+            .filter_map(|name| {
+                // "<table>.lance" -> "<table>", without parsing each entry as a path
+                name.strip_suffix(LANCE_EXTENSION)
+                    .and_then(|stem| stem.strip_suffix('.'))
+                    .filter(|stem| !stem.is_empty())
+                    .map(String::from)
             })
-            .filter_map(|p| p.file_stem().and_then(|s| s.to_str().map(String::from)))
             .collect::<Vec<String>>();
-        f.sort();
+        f.sort_unstable();
         if let Some(start_after) = options.start_after {
-            let index = f
-                .iter()
-                .position(|name| name.as_str() > start_after.as_str())
-                .unwrap_or(f.len());
+            // names are sorted, so binary search for the first one after the token
+            let index = f.partition_point(|name| name.as_str() <= start_after.as_str());
             f.drain(0..index);
         }
         if let Some(limit) = options.limit {
@@ -1152,18 +1173,11 @@ impl ConnectionInternal for Database {
                 _ => Error::from(err),
             })?;
 
-        let object_store_params = ObjectStoreParams {
-            storage_options: Some(self.storage_options.clone()),
-            ..Default::default()
-        };
-        let mut uri = self.uri.clone();
-        if let Some(query_string) = &self.query_string {
-            uri.push_str(&format!("?{}", query_string));
-        }
-        let commit_handler = commit_handler_from_url(&uri, &Some(object_store_params))
+        self.commit_handler()
+            .await
+            .delete(&full_path)
             .await
             .unwrap();
-        commit_handler.delete(&full_path).await.unwrap();
         Ok(())
     }
 